@@ -6,7 +6,7 @@ import logging
 import uuid
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 logger = logging.getLogger(__name__)
 from sqlalchemy import select, update
@@ -34,6 +34,12 @@ from backend.models.tables import (
 class PipelineState(BaseModel):
     """State flowing through the LangGraph pipeline."""
 
+    # Built hot (once per pipeline run plus every node boundary mutation):
+    # keep assignment validation off so `state.current_step = ...` is a plain
+    # setattr, and forbid extras so typos fail at construction instead of
+    # silently carrying dead fields through the run.
+    model_config = ConfigDict(extra="forbid", validate_assignment=False)
+
     application_id: str
     user_id: str
     jd_raw: str = ""
@@ -36,6 +36,8 @@ class Settings(BaseSettings):
     model_name: str = "gpt-4o"
     model_mini: str = "gpt-4o-mini"
     embedding_model: str = "text-embedding-3-small"
+    # Max concurrent OpenAI calls when fanning out over independent items.
+    openai_concurrency: int = 8
 
     # ── Temperature presets ──
     temp_parsing: float = 0.1
@@ -60,8 +62,21 @@ class Settings(BaseSettings):
     pipeline_timeout_s: int = 300
     pipeline_stale_lock_s: int = 180
 
+    # ── PDF export ──
+    # Persistent Tectonic bundle cache. On ephemeral containers the default
+    # XDG cache path is wiped on deploy, costing a ~20s package re-download
+    # on the first compile. Point this at a mounted volume to keep it warm
+    # (and prefetch with `tectonic -X bundle fetch` in the image build).
+    # Empty string keeps Tectonic's default location.
+    tectonic_cache_dir: str = Field(default="", alias="TECTONIC_CACHE_DIR")
+
     # ── Embedding cache ──
     embedding_cache_size: int = 2000
+    # On-disk L2 cache (SQLite) so embeddings survive worker restarts.
+    # Empty string disables it.
+    embedding_disk_cache_path: str = Field(default="", alias="EMBEDDING_CACHE_PATH")
+    # Store in-memory cache entries as int8 + scale (4x smaller, <0.5% recall loss).
+    embedding_cache_quantize: bool = False
 
     model_config = {"env_file": ".env", "extra": "ignore"}
 
@@ -1,9 +1,15 @@
+from pgvector.asyncpg import register_vector
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
 from backend.config import get_settings
 
 DATABASE_URL = get_settings().database_url
+# asyncpg speaks the Postgres binary protocol end-to-end, so JSONB bullets and
+# vector embeddings transfer as raw bytes rather than re-encoded text.
+if DATABASE_URL.startswith("postgresql://"):
+    DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
 
 engine = create_async_engine(
     DATABASE_URL,
@@ -23,6 +29,16 @@ engine = create_async_engine(
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
+@event.listens_for(engine.sync_engine, "connect")
+def _register_pgvector_codec(dbapi_connection, connection_record) -> None:
+    """Register pgvector's binary codec on every new asyncpg connection.
+
+    Embeddings then travel as raw little-endian floats (~6KB per 1536-dim
+    vector) instead of ASCII scientific notation (~30KB).
+    """
+    dbapi_connection.run_async(register_vector)
+
+
 class Base(DeclarativeBase):
     pass
 
@@ -11,9 +11,10 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     Text,
 )
-from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
+from sqlalchemy.dialects.postgresql import ARRAY, ENUM, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .database import Base
@@ -82,6 +83,8 @@ class WorkExperience(Base):
     domain_tags: Mapped[list | None] = mapped_column(ARRAY(Text))
     skill_tags: Mapped[list | None] = mapped_column(ARRAY(Text))
     embedding = mapped_column(Vector(1536), nullable=True)
+    search_text: Mapped[str | None] = mapped_column(Text)
+    content_hash: Mapped[bytes | None] = mapped_column(LargeBinary, index=True)
     variant_group_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True))
     is_primary_variant: Mapped[bool] = mapped_column(Boolean, default=True)
     similarity_score: Mapped[float | None] = mapped_column(Float)
@@ -135,6 +138,8 @@ class Project(Base):
     domain_tags: Mapped[list | None] = mapped_column(ARRAY(Text))
     skill_tags: Mapped[list | None] = mapped_column(ARRAY(Text))
     embedding = mapped_column(Vector(1536), nullable=True)
+    search_text: Mapped[str | None] = mapped_column(Text)
+    content_hash: Mapped[bytes | None] = mapped_column(LargeBinary, index=True)
     variant_group_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True))
     is_primary_variant: Mapped[bool] = mapped_column(Boolean, default=True)
     needs_review: Mapped[bool] = mapped_column(Boolean, default=False)
@@ -187,6 +192,8 @@ class Activity(Base):
     domain_tags: Mapped[list | None] = mapped_column(ARRAY(Text))
     skill_tags: Mapped[list | None] = mapped_column(ARRAY(Text))
     embedding = mapped_column(Vector(1536), nullable=True)
+    search_text: Mapped[str | None] = mapped_column(Text)
+    content_hash: Mapped[bytes | None] = mapped_column(LargeBinary, index=True)
     variant_group_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True))
     is_primary_variant: Mapped[bool] = mapped_column(Boolean, default=True)
     similarity_score: Mapped[float | None] = mapped_column(Float)
@@ -226,7 +233,18 @@ class Application(Base):
     jd_parsed: Mapped[dict | None] = mapped_column(JSONB)
     jd_source: Mapped[str | None] = mapped_column(Text)
     status: Mapped[str] = mapped_column(Text, default="draft", index=True)
-    outcome: Mapped[str | None] = mapped_column(Text, nullable=True)
+    outcome: Mapped[str | None] = mapped_column(
+        ENUM(
+            "applied",
+            "interview",
+            "offer",
+            "rejected",
+            "withdrawn",
+            name="application_outcome",
+            create_type=False,
+        ),
+        nullable=True,
+    )
     include_report: Mapped[bool] = mapped_column(Boolean, default=False)
     jd_url: Mapped[str | None] = mapped_column(Text, nullable=True)
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -241,10 +259,6 @@ class Application(Base):
             "status IN ('draft', 'tailoring', 'review', 'complete')",
             name="ck_applications_status",
         ),
-        CheckConstraint(
-            "outcome IS NULL OR outcome IN ('applied', 'interview', 'offer', 'rejected', 'withdrawn')",
-            name="ck_applications_outcome",
-        ),
     )
 
 
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
 import uuid
+from collections import defaultdict
 from datetime import date
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.models.tables import (
@@ -28,15 +31,20 @@ from backend.schemas.pydantic import (
 )
 from backend.config import get_settings
 from backend.services.cv_structurer import structure_cv_text
-from backend.services.deduplicator import deduplicate_activity, deduplicate_experience, deduplicate_project
+from backend.services.deduplicator import deduplicate_items
 from backend.services.embedder import embed_text
-from backend.services.pdf_parser import extract_docx_text, extract_pdf_text
+from backend.services.pdf_parser import extract_docx_text_async, extract_pdf_text_async
 from backend.utils import extract_bullet_texts
 
 logger = logging.getLogger(__name__)
 
 VALID_SKILL_CATEGORIES = {"technical", "language", "tool", "soft", "other", "certification", "framework", "interest"}
 
+# A real CV is well under 2 MB of PDF/DOCX. Anything larger is rejected up
+# front — before pdfplumber/python-docx burn CPU and before the upload row
+# is written.
+MAX_FILE_BYTES = 2 * 1024 * 1024
+
 
 def _parse_date(s: str | None) -> date | None:
     if not s:
@@ -65,11 +73,19 @@ async def parse_and_store_cv(
     Returns:
         ParseSummary with upload results.
     """
-    # Extract text
+    # Preflight: cheap integer comparison before any parsing or DB writes
+    if len(file_bytes) > MAX_FILE_BYTES:
+        raise ValueError(
+            f"File is too large ({len(file_bytes):,} bytes). "
+            f"Maximum size is {MAX_FILE_BYTES // (1024 * 1024)} MB."
+        )
+
+    # Extract text in a worker process — pdfplumber/python-docx are CPU-bound
+    # and would otherwise block the event loop for the whole extraction
     if file_type == "pdf":
-        raw_text, quality = extract_pdf_text(file_bytes)
+        raw_text, quality = await extract_pdf_text_async(file_bytes)
     else:
-        raw_text, quality = extract_docx_text(file_bytes)
+        raw_text, quality = await extract_docx_text_async(file_bytes)
 
     if not raw_text.strip():
         raise ValueError("Could not extract text from the file")
@@ -103,9 +119,20 @@ async def parse_and_store_cv(
         raise ValueError(parsed.rejection_reason or "The uploaded file does not appear to be a CV or resume.")
 
     review_items: list[ReviewItem] = []
-    duplicate_groups: dict[str, list[DuplicateItem]] = {}
+    duplicate_groups: defaultdict[str, list[DuplicateItem]] = defaultdict(list)
     cleanly_parsed_count = 0
 
+    # Pre-fetch the user's existing rows once per table so deduplication can
+    # score candidates in-process instead of issuing one query per new item.
+    # Newly stored items are appended as we go so later items in the same
+    # upload still see them.
+    dedup_candidates: dict[type, list] = {}
+    for model in (WorkExperience, Project, Activity):
+        result = await db.execute(
+            select(model).where(model.user_id == user_id, model.embedding.is_not(None))
+        )
+        dedup_candidates[model] = list(result.scalars().all())
+
     # Store profile
     _threshold = get_settings().confidence_review_threshold
 
@@ -139,16 +166,23 @@ async def parse_and_store_cv(
             review_reason="Low confidence on contact info extraction",
         ))
 
-    # Store work experiences
+    # Store work experiences — add all rows first, then one flush and one
+    # batched embeddings call for the whole section
+    new_experiences: list[tuple] = []  # (parsed exp, ORM row, issues)
     for exp in parsed.work_experiences:
-        needs_review = False
-        reasons = []
+        # One threshold pass: (field, confidence, current_value, reason)
+        issues = []
         if exp.company_confidence < _threshold:
-            needs_review = True
-            reasons.append(f"Low company confidence: {exp.company_confidence}")
+            issues.append((
+                "company", exp.company_confidence, exp.company,
+                f"Low company confidence: {exp.company_confidence}",
+            ))
         if exp.dates_confidence < _threshold:
-            needs_review = True
-            reasons.append(f"Low dates confidence: {exp.dates_confidence}")
+            issues.append((
+                "dates", exp.dates_confidence, f"{exp.date_start} - {exp.date_end}",
+                f"Low dates confidence: {exp.dates_confidence}",
+            ))
+        needs_review = bool(issues)
 
         work_exp = WorkExperience(
             user_id=user_id,
@@ -166,15 +200,26 @@ async def parse_and_store_cv(
             domain_tags=exp.domain_tags,
             skill_tags=exp.skill_tags,
             needs_review=needs_review,
-            review_reason="; ".join(reasons) if reasons else None,
+            review_reason="; ".join(reason for _, _, _, reason in issues) if issues else None,
         )
         db.add(work_exp)
-        await db.flush()
+        new_experiences.append((exp, work_exp, issues))
 
+    if new_experiences:
+        await db.flush()
+        exp_rows = [row for _, row, _ in new_experiences]
         try:
-            dedup_result = await deduplicate_experience(db, work_exp, user_id)
+            dedup_results = await deduplicate_items(
+                db, exp_rows, user_id, candidates=dedup_candidates[WorkExperience]
+            )
+        except Exception:
+            logger.exception("Deduplication failed for experience batch")
+            dedup_results = []
+            for row in exp_rows:
+                row.variant_group_id = uuid.uuid4()
+                row.is_primary_variant = True
+        for (exp, work_exp, _), dedup_result in zip(new_experiences, dedup_results):
             if dedup_result.action in ("near_duplicate", "variant"):
-                duplicate_groups.setdefault(str(dedup_result.variant_group_id), [])
                 duplicate_groups[str(dedup_result.variant_group_id)].append(
                     DuplicateItem(
                         id=work_exp.id, company=exp.company, role_title=exp.role_title,
@@ -182,18 +227,13 @@ async def parse_and_store_cv(
                         is_primary_variant=work_exp.is_primary_variant,
                     )
                 )
-        except Exception:
-            logger.exception("Deduplication failed for experience %s at %s", exp.role_title, exp.company)
-            work_exp.variant_group_id = uuid.uuid4()
-            work_exp.is_primary_variant = True
 
-        if needs_review:
-            for reason in reasons:
-                field = "company" if "company" in reason else "dates"
-                conf = exp.company_confidence if field == "company" else exp.dates_confidence
+    for exp, work_exp, issues in new_experiences:
+        if issues:
+            for field, conf, current_value, reason in issues:
                 review_items.append(ReviewItem(
                     id=work_exp.id, table="work_experiences", field=field,
-                    current_value=exp.company if field == "company" else f"{exp.date_start} - {exp.date_end}",
+                    current_value=current_value,
                     confidence=conf, review_reason=reason,
                 ))
         else:
@@ -233,7 +273,8 @@ async def parse_and_store_cv(
         else:
             cleanly_parsed_count += 1
 
-    # Store projects
+    # Store projects — batched the same way as experiences
+    new_projects: list[Project] = []
     for proj in parsed.projects:
         project = Project(
             user_id=user_id,
@@ -245,27 +286,37 @@ async def parse_and_store_cv(
             raw_block=proj.raw_block, domain_tags=proj.domain_tags, skill_tags=proj.skill_tags,
         )
         db.add(project)
-        await db.flush()
+        new_projects.append(project)
 
+    if new_projects:
+        await db.flush()
         try:
-            await deduplicate_project(db, project, user_id)
+            await deduplicate_items(
+                db, new_projects, user_id, candidates=dedup_candidates[Project]
+            )
         except Exception:
-            logger.exception("Deduplication failed for project %s", proj.name)
-            project.variant_group_id = uuid.uuid4()
-            project.is_primary_variant = True
-
-        cleanly_parsed_count += 1
-
-    # Store activities
+            logger.exception("Deduplication failed for project batch")
+            for project in new_projects:
+                project.variant_group_id = uuid.uuid4()
+                project.is_primary_variant = True
+        cleanly_parsed_count += len(new_projects)
+
+    # Store activities — batched the same way as experiences
+    new_activities: list[tuple] = []  # (parsed activity, ORM row, issues)
     for act in parsed.activities:
-        needs_review = False
-        reasons = []
+        # One threshold pass: (field, confidence, current_value, reason)
+        issues = []
         if act.company_confidence < _threshold:
-            needs_review = True
-            reasons.append(f"Low organization confidence: {act.company_confidence}")
+            issues.append((
+                "organization", act.company_confidence, act.company,
+                f"Low organization confidence: {act.company_confidence}",
+            ))
         if act.dates_confidence < _threshold:
-            needs_review = True
-            reasons.append(f"Low dates confidence: {act.dates_confidence}")
+            issues.append((
+                "dates", act.dates_confidence, f"{act.date_start} - {act.date_end}",
+                f"Low dates confidence: {act.dates_confidence}",
+            ))
+        needs_review = bool(issues)
 
         activity = Activity(
             user_id=user_id,
@@ -276,15 +327,27 @@ async def parse_and_store_cv(
             dates_confidence=act.dates_confidence,
             bullets=[{"text": b.text, "domain_tags": b.domain_tags} for b in act.bullets],
             raw_block=act.raw_block, domain_tags=act.domain_tags, skill_tags=act.skill_tags,
-            needs_review=needs_review, review_reason="; ".join(reasons) if reasons else None,
+            needs_review=needs_review,
+            review_reason="; ".join(reason for _, _, _, reason in issues) if issues else None,
         )
         db.add(activity)
-        await db.flush()
+        new_activities.append((act, activity, issues))
 
+    if new_activities:
+        await db.flush()
+        act_rows = [row for _, row, _ in new_activities]
         try:
-            dedup_result = await deduplicate_activity(db, activity, user_id)
+            dedup_results = await deduplicate_items(
+                db, act_rows, user_id, candidates=dedup_candidates[Activity]
+            )
+        except Exception:
+            logger.exception("Deduplication failed for activity batch")
+            dedup_results = []
+            for row in act_rows:
+                row.variant_group_id = uuid.uuid4()
+                row.is_primary_variant = True
+        for (act, activity, _), dedup_result in zip(new_activities, dedup_results):
             if dedup_result.action in ("near_duplicate", "variant"):
-                duplicate_groups.setdefault(str(dedup_result.variant_group_id), [])
                 duplicate_groups[str(dedup_result.variant_group_id)].append(
                     DuplicateItem(
                         id=activity.id, company=act.company, role_title=act.role_title,
@@ -292,18 +355,13 @@ async def parse_and_store_cv(
                         is_primary_variant=activity.is_primary_variant,
                     )
                 )
-        except Exception:
-            logger.exception("Deduplication failed for activity %s at %s", act.role_title, act.company)
-            activity.variant_group_id = uuid.uuid4()
-            activity.is_primary_variant = True
 
-        if needs_review:
-            for reason in reasons:
-                field = "organization" if "organization" in reason else "dates"
-                conf = act.company_confidence if field == "organization" else act.dates_confidence
+    for act, activity, issues in new_activities:
+        if issues:
+            for field, conf, current_value, reason in issues:
                 review_items.append(ReviewItem(
                     id=activity.id, table="activities", field=field,
-                    current_value=act.company if field == "organization" else f"{act.date_start} - {act.date_end}",
+                    current_value=current_value,
                     confidence=conf, review_reason=reason,
                 ))
         else:
@@ -328,22 +386,36 @@ async def parse_and_store_cv(
         ))
         cleanly_parsed_count += 1
 
-    # Store unclassified blocks
+    # Store unclassified blocks — one bulk INSERT ... RETURNING id instead of
+    # a flush round-trip per block
     unclassified_out: list[UnclassifiedBlockOut] = []
-    for block in parsed.unclassified_blocks:
-        ub = UnclassifiedBlock(
-            user_id=user_id,
-            upload_source_id=upload.id,
-            raw_text=block.raw_text,
-            gpt_category_guess=block.category_guess,
-            gpt_confidence=block.confidence,
+    if parsed.unclassified_blocks:
+        rows = [
+            {
+                "user_id": user_id,
+                "upload_source_id": upload.id,
+                "raw_text": block.raw_text,
+                "gpt_category_guess": block.category_guess,
+                "gpt_confidence": block.confidence,
+            }
+            for block in parsed.unclassified_blocks
+        ]
+        # sort_by_parameter_order: insertmanyvalues doesn't guarantee
+        # RETURNING rows come back in parameter order otherwise, and the
+        # zip below relies on it.
+        result = await db.execute(
+            insert(UnclassifiedBlock).returning(
+                UnclassifiedBlock.id, sort_by_parameter_order=True
+            ),
+            rows,
         )
-        db.add(ub)
-        await db.flush()
-        unclassified_out.append(UnclassifiedBlockOut(
-            id=ub.id, raw_text=block.raw_text,
-            gpt_category_guess=block.category_guess, gpt_confidence=block.confidence,
-        ))
+        unclassified_out = [
+            UnclassifiedBlockOut(
+                id=block_id, raw_text=block.raw_text,
+                gpt_category_guess=block.category_guess, gpt_confidence=block.confidence,
+            )
+            for block_id, block in zip(result.scalars().all(), parsed.unclassified_blocks)
+        ]
 
     await db.commit()
 
@@ -360,8 +432,25 @@ async def parse_and_store_cv(
 
 
 async def re_embed_all(db: AsyncSession, user_id: uuid.UUID) -> dict:
-    """Re-generate embeddings for all records with NULL embeddings."""
+    """Re-generate embeddings for all records with NULL embeddings.
+
+    Items are independent, so embedding calls run concurrently under a
+    bounded semaphore instead of serializing N round trips; failures are
+    logged per item and don't abort the batch.
+    """
     counts = {}
+    sem = asyncio.Semaphore(get_settings().openai_concurrency)
+
+    async def _embed_one(item, embed_input: str, label: str) -> bool:
+        try:
+            async with sem:
+                item.embedding = await embed_text(embed_input)
+        except Exception:
+            logger.exception("Failed to embed %s %s", label, item.id)
+            return False
+        item.search_text = embed_input[:200]
+        item.content_hash = hashlib.blake2b(embed_input.encode(), digest_size=16).digest()
+        return True
 
     for model, name_field, label in [
         (WorkExperience, "company", "experiences"),
@@ -375,18 +464,14 @@ async def re_embed_all(db: AsyncSession, user_id: uuid.UUID) -> dict:
             )
         )
         items = result.scalars().all()
-        count = 0
+        tasks = []
         for item in items:
             bullet_texts = extract_bullet_texts(getattr(item, "bullets", None))
             name = getattr(item, name_field, "") or ""
             role = getattr(item, "role_title", "") or getattr(item, "description", "") or ""
-            embed_input = f"{name} {role} " + " ".join(bullet_texts)
-            try:
-                item.embedding = await embed_text(embed_input)
-                count += 1
-            except Exception:
-                logger.exception("Failed to embed %s %s", label, item.id)
-        counts[f"{label}_embedded"] = count
+            embed_input = " ".join(filter(None, (name, role, *bullet_texts)))
+            tasks.append(_embed_one(item, embed_input, label))
+        counts[f"{label}_embedded"] = sum(await asyncio.gather(*tasks))
 
     await db.commit()
     return {"status": "complete", **counts}
@@ -15,6 +15,19 @@ from backend.schemas.pydantic import StructuredCvParse
 
 logger = logging.getLogger(__name__)
 
+# Process-local parse cache in front of cv_parse_cache — repeat uploads on a
+# warm worker skip even the Postgres SELECT. Plain dict with FIFO eviction;
+# keys are SHA-256 hashes so there is no need to hash the full text again.
+_MEM_CACHE_MAX = 128
+_mem_cache: dict[str, StructuredCvParse] = {}
+
+
+def _mem_cache_set(text_hash: str, parsed: StructuredCvParse) -> None:
+    if len(_mem_cache) >= _MEM_CACHE_MAX:
+        _mem_cache.pop(next(iter(_mem_cache)))  # evict oldest insertion
+    _mem_cache[text_hash] = parsed
+
+
 # ---------------------------------------------------------------------------
 # System prompt — kept above 1 024 tokens so OpenAI's automatic prompt
 # caching activates and halves the cost of the prompt on repeated calls.
@@ -86,6 +99,11 @@ Output quality checklist — before returning verify:
 - Domain tags and skill_tags are non-empty arrays where content exists.
 """
 
+# Frozen at import: the system message must stay byte-identical across calls
+# (and across workers) or OpenAI's automatic prompt caching misses.
+SYSTEM_PROMPT = SYSTEM_PROMPT.strip()
+SYSTEM_MSG = {"role": "system", "content": SYSTEM_PROMPT}
+
 
 # ---------------------------------------------------------------------------
 # LinkedIn export detection
@@ -128,7 +146,7 @@ async def _call_openai_parse(raw_text: str, extra_hint: str = "") -> StructuredC
     response = await client.beta.chat.completions.parse(
         model=settings.model_name,
         messages=[
-            {"role": "system", "content": SYSTEM_PROMPT},
+            SYSTEM_MSG,
             {"role": "user", "content": user_content},
         ],
         response_format=StructuredCvParse,
@@ -160,6 +178,11 @@ async def structure_cv_text(
     text_hash = hashlib.sha256(raw_text.encode()).hexdigest()
 
     # ── Cache read ──────────────────────────────────────────────────────────
+    cached_in_mem = _mem_cache.get(text_hash)
+    if cached_in_mem is not None:
+        logger.info("in-process parse cache hit for hash %s", text_hash[:12])
+        return cached_in_mem
+
     if db is not None:
         try:
             row = await db.execute(
@@ -169,13 +192,16 @@ async def structure_cv_text(
             cached = row.scalar_one_or_none()
             if cached:
                 logger.info("cv_parse_cache hit for hash %s", text_hash[:12])
-                return StructuredCvParse.model_validate_json(cached)
+                parsed = StructuredCvParse.model_validate_json(cached)
+                _mem_cache_set(text_hash, parsed)
+                return parsed
         except Exception:
             logger.warning("cv_parse_cache read failed — falling back to OpenAI", exc_info=True)
 
     # ── OpenAI call ─────────────────────────────────────────────────────────
     extra_hint = _LINKEDIN_HINTS if _is_linkedin_export(raw_text) else ""
     result = await _call_openai_parse(raw_text, extra_hint=extra_hint)
+    _mem_cache_set(text_hash, result)
 
     # ── Cache write (non-fatal) ──────────────────────────────────────────────
     if db is not None:
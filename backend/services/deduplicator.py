@@ -2,18 +2,35 @@
 
 from __future__ import annotations
 
+import hashlib
 import uuid
 from dataclasses import dataclass
 
-from sqlalchemy import bindparam, text
+import numpy as np
+from sqlalchemy import bindparam, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from pgvector.sqlalchemy import Vector
 
 from backend.config import get_settings
 from backend.models.tables import Activity, Project, WorkExperience
-from backend.services.embedder import embed_text
+from backend.services.embedder import embed_texts
 from backend.utils import extract_bullet_texts
 
+_TABLE_FOR_MODEL = {
+    WorkExperience: "work_experiences",
+    Project: "projects",
+    Activity: "activities",
+}
+
+# Models with a similarity_score column (Project has none) — a set probe is
+# cheaper than hasattr's getattr-under-try on the per-item classify path.
+_HAS_SIMILARITY_SCORE = {WorkExperience, Activity}
+
+# Cutoff for the trigram prefilter's % operator. Pinned per transaction via
+# SET LOCAL so the prefilter doesn't silently inherit whatever
+# pg_trgm.similarity_threshold the server/session happens to carry.
+_TRGM_SIMILARITY_THRESHOLD = 0.3
+
 
 @dataclass
 class DeduplicationResult:
@@ -23,6 +40,81 @@ class DeduplicationResult:
     variant_group_id: uuid.UUID
 
 
+async def _find_similar_batch(
+    db: AsyncSession,
+    table_name: str,
+    embeddings: list[list[float]],
+    threshold: float,
+    user_id: uuid.UUID,
+    query_texts: list[str] | None = None,
+) -> list[list[tuple[uuid.UUID, uuid.UUID | None, float]]]:
+    """Find similar rows for a batch of query embeddings in one round-trip.
+
+    A VALUES list of (tag, embedding) is joined laterally against the target
+    table, so N query embeddings cost one SQL statement instead of N.
+    When *query_texts* is given, candidates are prefiltered by trigram
+    similarity on search_text (GIN-indexed) before any vector distance is
+    computed; rows without search_text are never prefiltered out.
+    Returns, per input embedding, a list of (id, variant_group_id,
+    similarity_score) sorted by similarity descending.
+    """
+    if query_texts is not None:
+        values_sql = ", ".join(
+            f"(:tag{i}, CAST(:emb{i} AS vector), :qtext{i})" for i in range(len(embeddings))
+        )
+        values_cols = "q(tag, emb, qtext)"
+        prefilter_sql = "AND (search_text IS NULL OR search_text % q.qtext)"
+    else:
+        values_sql = ", ".join(
+            f"(:tag{i}, CAST(:emb{i} AS vector))" for i in range(len(embeddings))
+        )
+        values_cols = "q(tag, emb)"
+        prefilter_sql = ""
+    # text-embedding-3-small vectors are unit-norm, so inner product equals
+    # cosine similarity — <#> (negative inner product) skips the per-row
+    # norm/sqrt/division that <=> pays. Postgres does not CSE the operator
+    # expression, so compute the distance once in the lateral subquery and
+    # filter/order on the alias.
+    stmt = text(f"""
+        SELECT q.tag, t.id, t.variant_group_id, -t.distance AS similarity
+        FROM (VALUES {values_sql}) AS {values_cols}
+        CROSS JOIN LATERAL (
+            SELECT id, variant_group_id, embedding <#> q.emb AS distance
+            FROM {table_name}
+            WHERE embedding IS NOT NULL
+              AND user_id = :user_id
+              {prefilter_sql}
+            ORDER BY distance
+            LIMIT 5
+        ) t
+        WHERE t.distance < :distance_threshold
+        ORDER BY q.tag, t.distance
+    """).bindparams(*[bindparam(f"emb{i}", type_=Vector) for i in range(len(embeddings))])
+
+    # <#> returns the negated inner product, so "similarity > threshold"
+    # becomes "distance < -threshold".
+    params: dict = {"distance_threshold": -threshold, "user_id": user_id}
+    for i, embedding in enumerate(embeddings):
+        params[f"tag{i}"] = i
+        params[f"emb{i}"] = embedding
+        if query_texts is not None:
+            params[f"qtext{i}"] = query_texts[i]
+
+    # Widen the HNSW candidate list a little beyond the default (recall over
+    # raw speed — the table is tiny relative to the index's working set).
+    # SET LOCAL scopes this to the current transaction.
+    await db.execute(text("SET LOCAL hnsw.ef_search = 40"))
+    if query_texts is not None:
+        await db.execute(
+            text(f"SET LOCAL pg_trgm.similarity_threshold = {_TRGM_SIMILARITY_THRESHOLD}")
+        )
+    result = await db.execute(stmt, params)
+    by_tag: dict[int, list[tuple[uuid.UUID, uuid.UUID | None, float]]] = {}
+    for tag, row_id, group_id, similarity in result.fetchall():
+        by_tag.setdefault(tag, []).append((row_id, group_id, similarity))
+    return [by_tag.get(i, []) for i in range(len(embeddings))]
+
+
 async def _find_similar(
     db: AsyncSession,
     table_name: str,
@@ -34,21 +126,47 @@ async def _find_similar(
 
     Returns list of (id, variant_group_id, similarity_score).
     """
-    stmt = text(f"""
-        SELECT id, variant_group_id,
-               1 - (embedding <=> :embedding) as similarity
-        FROM {table_name}
-        WHERE embedding IS NOT NULL
-                    AND user_id = :user_id
-          AND 1 - (embedding <=> :embedding) > :threshold
-        ORDER BY similarity DESC
-        LIMIT 5
-    """).bindparams(bindparam("embedding", type_=Vector))
-    result = await db.execute(
-        stmt,
-                {"embedding": embedding, "threshold": threshold, "user_id": user_id},
-    )
-    return [(row[0], row[1], row[2]) for row in result.fetchall()]
+    return (await _find_similar_batch(db, table_name, [embedding], threshold, user_id))[0]
+
+
+def _find_similar_prefetched(
+    candidates: list,
+    embedding: list[float],
+    threshold: float,
+) -> list[tuple[uuid.UUID, uuid.UUID | None, float]]:
+    """In-process equivalent of _find_similar over pre-fetched candidate rows.
+
+    Used when the caller (e.g. parse_and_store_cv) already holds the user's
+    existing rows, so a batch of N new items costs zero similarity queries
+    instead of N. Scoring is one float32 matrix-vector product over all
+    candidates at once rather than a Python loop per pair.
+    """
+    vectors = []
+    meta = []
+    for cand in candidates:
+        cand_embedding = getattr(cand, "embedding", None)
+        if cand_embedding is None:
+            continue
+        vectors.append(np.asarray(cand_embedding, dtype=np.float32))
+        meta.append((cand.id, cand.variant_group_id))
+    if not vectors:
+        return []
+
+    matrix = np.stack(vectors)
+    query = np.asarray(embedding, dtype=np.float32)
+    # cosine = (M @ q) / (|rows| * |q|). OpenAI embeddings are unit-norm, but
+    # rows loaded back from Postgres aren't guaranteed to be, so normalize.
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+    norms[norms == 0.0] = np.inf
+    sims = (matrix @ query) / norms
+
+    # argpartition finds the top-5 in O(N) without sorting all N scores.
+    top = np.argpartition(sims, -5)[-5:] if len(sims) > 5 else range(len(sims))
+    scored = [
+        (meta[i][0], meta[i][1], float(sims[i])) for i in top if sims[i] > threshold
+    ]
+    scored.sort(key=lambda row: row[2], reverse=True)
+    return scored
 
 
 def _classify(
@@ -69,7 +187,7 @@ def _classify(
     group_id = best_group_id or uuid.uuid4()
     item.variant_group_id = group_id
     item.is_primary_variant = False
-    if hasattr(item, "similarity_score"):
+    if type(item) in _HAS_SIMILARITY_SCORE:
         item.similarity_score = best_score
 
     action = "near_duplicate" if best_score > near_threshold else "variant"
@@ -81,70 +199,191 @@ def _classify(
     )
 
 
+async def _find_exact_matches(
+    db: AsyncSession,
+    items: list,
+    digests: list[bytes],
+    user_id: uuid.UUID,
+    candidates: list | None,
+) -> dict[int, tuple[uuid.UUID, uuid.UUID | None, object]]:
+    """Map item index → (existing id, variant_group_id, embedding) for
+    byte-identical content.
+
+    Matches on the indexed content_hash column (or the prefetched candidate
+    rows), so exact re-uploads never reach the embeddings API. The matched
+    row's embedding rides along so the caller can copy it onto the new item
+    — hash-settled rows must not be committed with a NULL embedding, or the
+    draft selector (which filters embedding IS NOT NULL) never sees them.
+    """
+    if candidates is not None:
+        by_hash: dict[bytes, tuple[uuid.UUID, uuid.UUID | None, object]] = {}
+        for cand in candidates:
+            digest = getattr(cand, "content_hash", None)
+            if digest is not None and digest not in by_hash:
+                by_hash[digest] = (cand.id, cand.variant_group_id, cand.embedding)
+        return {i: by_hash[d] for i, d in enumerate(digests) if d in by_hash}
+
+    model = type(items[0])
+    result = await db.execute(
+        select(model.id, model.variant_group_id, model.content_hash, model.embedding).where(
+            model.user_id == user_id,
+            model.content_hash.in_(set(digests)),
+        )
+    )
+    rows_by_hash: dict[bytes, list[tuple[uuid.UUID, uuid.UUID | None, object]]] = {}
+    for row_id, group_id, digest, embedding in result:
+        rows_by_hash.setdefault(bytes(digest), []).append((row_id, group_id, embedding))
+
+    exact: dict[int, tuple[uuid.UUID, uuid.UUID | None, object]] = {}
+    for i, (item, digest) in enumerate(zip(items, digests)):
+        for row_id, group_id, embedding in rows_by_hash.get(digest, ()):
+            # Autoflush can surface the item's own pending row; skip it.
+            if row_id != item.id:
+                exact[i] = (row_id, group_id, embedding)
+                break
+    return exact
+
+
+def _embed_input(item) -> str:
+    """Build the text embedded for similarity search, per item type."""
+    if isinstance(item, Project):
+        head, sub = item.name, item.description
+    elif isinstance(item, Activity):
+        head, sub = item.organization, item.role_title
+    else:
+        head, sub = item.company, item.role_title
+    # Single join — no intermediate f-string + concat copies; filter(None)
+    # skips empty fields so they don't leave double spaces behind.
+    return " ".join(filter(None, (head, sub, *extract_bullet_texts(item.bullets))))
+
+
+async def deduplicate_items(
+    db: AsyncSession,
+    items: list,
+    user_id: uuid.UUID,
+    candidates: list | None = None,
+) -> list[DeduplicationResult]:
+    """Deduplicate a batch of same-table items with one embeddings call.
+
+    Items whose embed input is byte-identical to an existing row are settled
+    by content hash without any embedding work. The remaining embed inputs
+    go to OpenAI in a single request (cache misses only),
+    then each item is classified against *candidates* in-process when
+    provided, or via a per-item vector query otherwise. Classified items are
+    appended to *candidates* so later items in the batch can match them.
+    """
+    if not items:
+        return []
+    # Read settings once per batch, then thread plain floats through the
+    # per-item loops — no attribute chain on the hot path.
+    settings = get_settings()
+    variant_threshold = settings.variant_threshold
+    near_threshold = settings.near_duplicate_threshold
+
+    inputs = [_embed_input(item) for item in items]
+    digests = [hashlib.blake2b(inp.encode(), digest_size=16).digest() for inp in inputs]
+    for item, embed_input, digest in zip(items, inputs, digests):
+        # Trigram-indexed prefilter text for the batch similarity query.
+        item.search_text = embed_input[:200]
+        item.content_hash = digest
+
+    # Byte-identical content (same resume re-uploaded, same section
+    # regenerated) is a near_duplicate by definition — settle those by hash
+    # and only run the embedding pipeline for genuinely new text.
+    exact = await _find_exact_matches(db, items, digests, user_id, candidates)
+
+    results: dict[int, DeduplicationResult] = {}
+    pending: list[int] = []
+    for i, item in enumerate(items):
+        match = exact.get(i)
+        # A match whose row predates the embedding backfill has no vector to
+        # reuse — run those through the embedding path like any new item.
+        if match is None or match[2] is None:
+            pending.append(i)
+            continue
+        match_id, match_group, match_embedding = match
+        group_id = match_group or uuid.uuid4()
+        item.variant_group_id = group_id
+        item.is_primary_variant = False
+        # Identical text ⇒ identical embedding: reuse the matched row's
+        # vector so the hash fast path never commits an embedding-less row
+        # (the draft selector filters on embedding IS NOT NULL).
+        item.embedding = match_embedding
+        if type(item) in _HAS_SIMILARITY_SCORE:
+            item.similarity_score = 1.0
+        results[i] = DeduplicationResult(
+            action="near_duplicate",
+            existing_id=match_id,
+            similarity_score=1.0,
+            variant_group_id=group_id,
+        )
+
+    if pending:
+        embeddings = await embed_texts([inputs[i] for i in pending])
+        for i, embedding in zip(pending, embeddings):
+            items[i].embedding = embedding
+
+        if candidates is not None:
+            for i, embedding in zip(pending, embeddings):
+                item = items[i]
+                similar = _find_similar_prefetched(candidates, embedding, variant_threshold)
+                results[i] = _classify(similar, item, near_threshold)
+                candidates.append(item)
+        else:
+            batch_similar = await _find_similar_batch(
+                db,
+                _TABLE_FOR_MODEL[type(items[0])],
+                embeddings,
+                variant_threshold,
+                user_id,
+                query_texts=[items[i].search_text for i in pending],
+            )
+            for i, similar in zip(pending, batch_similar):
+                item = items[i]
+                # The batch query can see the item's own freshly flushed row;
+                # never classify an item against itself.
+                similar = [row for row in similar if row[0] != item.id]
+                results[i] = _classify(similar, item, near_threshold)
+    return [results[i] for i in range(len(items))]
+
+
 async def deduplicate_experience(
     db: AsyncSession,
     experience: WorkExperience,
     user_id: uuid.UUID,
+    candidates: list[WorkExperience] | None = None,
 ) -> DeduplicationResult:
-    """Check if a work experience is a duplicate/variant of an existing one."""
-    settings = get_settings()
-    bullet_texts = extract_bullet_texts(experience.bullets)
-    embed_input = f"{experience.company or ''} {experience.role_title or ''} " + " ".join(bullet_texts)
-
-    embedding = await embed_text(embed_input)
-    experience.embedding = embedding
-
-    similar = await _find_similar(
-        db,
-        "work_experiences",
-        embedding,
-        settings.variant_threshold,
-        user_id,
-    )
-    return _classify(similar, experience, settings.near_duplicate_threshold)
+    """Check if a work experience is a duplicate/variant of an existing one.
+
+    Pass *candidates* (the user's existing rows, fetched once) to score
+    similarity in-process instead of issuing a per-item vector query.
+    """
+    return (await deduplicate_items(db, [experience], user_id, candidates=candidates))[0]
 
 
 async def deduplicate_project(
     db: AsyncSession,
     project: Project,
     user_id: uuid.UUID,
+    candidates: list[Project] | None = None,
 ) -> DeduplicationResult:
-    """Check if a project is a duplicate/variant of an existing one."""
-    settings = get_settings()
-    bullet_texts = extract_bullet_texts(project.bullets)
-    embed_input = f"{project.name or ''} {project.description or ''} " + " ".join(bullet_texts)
-
-    embedding = await embed_text(embed_input)
-    project.embedding = embedding
-
-    similar = await _find_similar(
-        db,
-        "projects",
-        embedding,
-        settings.variant_threshold,
-        user_id,
-    )
-    return _classify(similar, project, settings.near_duplicate_threshold)
+    """Check if a project is a duplicate/variant of an existing one.
+
+    Pass *candidates* (the user's existing rows, fetched once) to score
+    similarity in-process instead of issuing a per-item vector query.
+    """
+    return (await deduplicate_items(db, [project], user_id, candidates=candidates))[0]
 
 
 async def deduplicate_activity(
     db: AsyncSession,
     activity: Activity,
     user_id: uuid.UUID,
+    candidates: list[Activity] | None = None,
 ) -> DeduplicationResult:
-    """Check if an activity is a duplicate/variant of an existing one."""
-    settings = get_settings()
-    bullet_texts = extract_bullet_texts(activity.bullets)
-    embed_input = f"{activity.organization or ''} {activity.role_title or ''} " + " ".join(bullet_texts)
-
-    embedding = await embed_text(embed_input)
-    activity.embedding = embedding
-
-    similar = await _find_similar(
-        db,
-        "activities",
-        embedding,
-        settings.variant_threshold,
-        user_id,
-    )
-    return _classify(similar, activity, settings.near_duplicate_threshold)
+    """Check if an activity is a duplicate/variant of an existing one.
+
+    Pass *candidates* (the user's existing rows, fetched once) to score
+    similarity in-process instead of issuing a per-item vector query.
+    """
+    return (await deduplicate_items(db, [activity], user_id, candidates=candidates))[0]
@@ -2,80 +2,221 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import logging
+import sqlite3
 from collections import OrderedDict
 
+import numpy as np
+
 from backend.clients import get_openai_client
 from backend.config import get_settings
 from backend.utils import retry_openai
 
+logger = logging.getLogger(__name__)
+
 # ---------------------------------------------------------------------------
 # In-process LRU cache — survives for the lifetime of the process.
 # Embeddings are fully deterministic (same text → same vector), so there is
-# no correctness risk in caching indefinitely.
+# no correctness risk in caching indefinitely. Keys are whitespace-collapsed,
+# lowercased texts — the dict's built-in string hash is far cheaper than
+# hashing every lookup with SHA-256, and the cache is purely process-local so
+# there is nothing to protect cryptographically.
 # ---------------------------------------------------------------------------
 _CACHE_MAX = get_settings().embedding_cache_size
-_cache: OrderedDict[str, list[float]] = OrderedDict()
+# With quantization on, entries are (int8 vector, scale) pairs — 4x smaller
+# at a similarity cost well below the dedup thresholds.
+_QUANTIZE = get_settings().embedding_cache_quantize
+_cache: OrderedDict[str, np.ndarray | tuple[np.ndarray, float]] = OrderedDict()
+
+
+def _cache_key(text: str) -> str:
+    """Normalize a text into its cache key.
+
+    Trivial formatting differences — double spaces from empty fields, trailing
+    whitespace, case drift in company names — shouldn't cost a second API
+    call. The original text is still what gets sent to OpenAI.
+    """
+    return " ".join(text.split()).lower()
 
 
-def _cache_get(text: str) -> list[float] | None:
-    key = hashlib.sha256(text.encode()).hexdigest()
-    if key not in _cache:
-        return None
-    # Move to end (most-recently-used)
-    _cache.move_to_end(key)
-    return _cache[key]
+def _quantize(embedding: np.ndarray) -> tuple[np.ndarray, float]:
+    scale = float(np.abs(embedding).max()) / 127.0
+    if scale == 0.0:
+        scale = 1.0
+    return np.round(embedding / scale).astype(np.int8), scale
+
+
+def _dequantize(entry: tuple[np.ndarray, float]) -> np.ndarray:
+    q, scale = entry
+    return q.astype(np.float32) * scale
+
+# ---------------------------------------------------------------------------
+# Optional on-disk L2 cache (SQLite) — survives worker restarts, so deploys
+# and scale-outs don't re-embed text that never changed. Vectors are packed
+# as raw float32 (~6KB per 1536-dim embedding). All disk failures are
+# non-fatal: a broken L2 just means the API is called again.
+# ---------------------------------------------------------------------------
+_disk_cache: sqlite3.Connection | None = None
 
 
-def _cache_set(text: str, embedding: list[float]) -> None:
-    key = hashlib.sha256(text.encode()).hexdigest()
+def _get_disk_cache() -> sqlite3.Connection | None:
+    global _disk_cache
+    if _disk_cache is None:
+        path = get_settings().embedding_disk_cache_path
+        if not path:
+            return None
+        try:
+            _disk_cache = sqlite3.connect(path, check_same_thread=False)
+            _disk_cache.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, vec BLOB NOT NULL)"
+            )
+            _disk_cache.commit()
+        except sqlite3.Error:
+            logger.warning("Could not open embedding disk cache at %s", path, exc_info=True)
+            return None
+    return _disk_cache
+
+
+def _disk_key(text: str) -> bytes:
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+
+def _l1_set(text: str, embedding: np.ndarray) -> None:
     if len(_cache) >= _CACHE_MAX:
         _cache.popitem(last=False)  # evict least-recently-used
-    _cache[key] = embedding
+    _cache[text] = _quantize(embedding) if _QUANTIZE else embedding
+
+
+def _cache_get(text: str) -> np.ndarray | None:
+    if text in _cache:
+        # Move to end (most-recently-used)
+        _cache.move_to_end(text)
+        entry = _cache[text]
+        return _dequantize(entry) if _QUANTIZE else entry
+
+    disk = _get_disk_cache()
+    if disk is not None:
+        try:
+            row = disk.execute(
+                "SELECT vec FROM embeddings WHERE key = ?", (_disk_key(text),)
+            ).fetchone()
+        except sqlite3.Error:
+            logger.warning("Embedding disk cache read failed", exc_info=True)
+            row = None
+        if row is not None:
+            embedding = np.frombuffer(row[0], dtype=np.float32)
+            _l1_set(text, embedding)
+            return embedding
+    return None
+
+
+def _cache_set(text: str, embedding: np.ndarray) -> None:
+    _l1_set(text, embedding)
+    disk = _get_disk_cache()
+    if disk is not None:
+        try:
+            disk.execute(
+                "INSERT OR REPLACE INTO embeddings (key, vec) VALUES (?, ?)",
+                (_disk_key(text), embedding.tobytes()),
+            )
+            disk.commit()
+        except sqlite3.Error:
+            logger.warning("Embedding disk cache write failed", exc_info=True)
 
 
 # ---------------------------------------------------------------------------
 # Internal OpenAI caller — retry decorator lives here, not on the public API
 # ---------------------------------------------------------------------------
 
+# One-shot guard: the dedup SQL assumes unit-norm vectors (inner product ==
+# cosine). Checked once on the first API response in case the model changes.
+_norm_checked = False
+
+
 @retry_openai()
-async def _call_openai_embeddings(texts: list[str]) -> list[list[float]]:
+async def _call_openai_embeddings(texts: list[str]) -> list[np.ndarray]:
+    global _norm_checked
     client = get_openai_client()
     settings = get_settings()
     response = await client.embeddings.create(
         model=settings.embedding_model,
         input=texts,
     )
-    return [item.embedding for item in response.data]
+    # float32 arrays: ~6KB per 1536-dim vector vs ~42KB as boxed Python floats
+    embeddings = [np.asarray(item.embedding, dtype=np.float32) for item in response.data]
+    if not _norm_checked and embeddings:
+        _norm_checked = True
+        norm = float(np.linalg.norm(embeddings[0]))
+        if abs(norm - 1.0) > 1e-3:
+            logger.warning(
+                "Embedding model %s returned a non-unit-norm vector (|v|=%.4f); "
+                "inner-product similarity search assumes unit norm",
+                settings.embedding_model, norm,
+            )
+    return embeddings
 
 
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
-async def embed_text(text: str) -> list[float]:
+# In-flight coalescing: concurrent embed_text calls for the same cold text
+# await a single OpenAI request instead of racing to duplicate it.
+_inflight: dict[str, asyncio.Future] = {}
+
+
+async def embed_text(text: str) -> np.ndarray:
     """Generate a 1536-dimensional embedding, served from cache when possible."""
-    cached = _cache_get(text)
+    key = _cache_key(text)
+    cached = _cache_get(key)
     if cached is not None:
         return cached
-    result = (await _call_openai_embeddings([text]))[0]
-    _cache_set(text, result)
+
+    pending = _inflight.get(key)
+    if pending is not None:
+        return await pending
+
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        result = (await _call_openai_embeddings([text]))[0]
+    except Exception as exc:
+        future.set_exception(exc)
+        future.exception()  # mark retrieved for the no-waiter case
+        raise
+    finally:
+        _inflight.pop(key, None)
+    _cache_set(key, result)
+    future.set_result(result)
     return result
 
 
-async def embed_texts(texts: list[str]) -> list[list[float]]:
+async def embed_texts(texts: list[str]) -> list[np.ndarray]:
     """Generate embeddings for multiple texts, only calling the API for cache misses."""
     if not texts:
         return []
 
-    results: list[list[float] | None] = [_cache_get(t) for t in texts]
+    keys = [_cache_key(t) for t in texts]
+    results: list[np.ndarray | None] = [_cache_get(k) for k in keys]
 
     miss_indices = [i for i, r in enumerate(results) if r is None]
     if miss_indices:
-        miss_texts = [texts[i] for i in miss_indices]
-        embeddings = await _call_openai_embeddings(miss_texts)
-        for idx, emb in zip(miss_indices, embeddings):
-            _cache_set(texts[idx], emb)
-            results[idx] = emb
+        # A batch can repeat the same text (boilerplate bullets, identical
+        # empty-field items) — the API bills per occurrence, so embed each
+        # unique text once and fan the result back out.
+        unique_miss: dict[str, list[int]] = {}
+        for i in miss_indices:
+            unique_miss.setdefault(keys[i], []).append(i)
+        # Send the first original occurrence, not the normalized key — case
+        # can still matter subtly to the model.
+        embeddings = await _call_openai_embeddings(
+            [texts[indices[0]] for indices in unique_miss.values()]
+        )
+        for (key, indices), emb in zip(unique_miss.items(), embeddings):
+            _cache_set(key, emb)
+            for idx in indices:
+                results[idx] = emb
 
     return results  # type: ignore[return-value]
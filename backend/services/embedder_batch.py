@@ -0,0 +1,116 @@
+"""Bulk embedding backfill via the OpenAI Batch API.
+
+Batch jobs run offline at half the synchronous price with a ≤24h completion
+window — the right trade for backfills after a migration or data import,
+where nobody is waiting on the result. Interactive dedup keeps using the
+synchronous embedder.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import uuid
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.clients import get_openai_client
+from backend.config import get_settings
+from backend.services.deduplicator import _embed_input
+from backend.utils import retry_openai
+
+logger = logging.getLogger(__name__)
+
+
+@retry_openai()
+async def submit_embedding_backfill(db: AsyncSession, model) -> str | None:
+    """Queue a batch job embedding every row of *model* without an embedding.
+
+    Returns the batch id, or None when there is nothing to backfill. Poll
+    with fetch_batch_results once the job completes.
+    """
+    settings = get_settings()
+    result = await db.execute(select(model).where(model.embedding.is_(None)))
+    rows = result.scalars().all()
+    if not rows:
+        return None
+
+    lines = [
+        json.dumps({
+            "custom_id": str(row.id),
+            "method": "POST",
+            "url": "/v1/embeddings",
+            "body": {"model": settings.embedding_model, "input": _embed_input(row)},
+        })
+        for row in rows
+    ]
+    client = get_openai_client()
+    batch_file = await client.files.create(
+        file=("embeddings.jsonl", "\n".join(lines).encode()),
+        purpose="batch",
+    )
+    batch = await client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/embeddings",
+        completion_window="24h",
+        metadata={"table": model.__tablename__},
+    )
+    logger.info("Submitted embedding backfill batch %s (%d rows)", batch.id, len(rows))
+    return batch.id
+
+
+@retry_openai()
+async def fetch_batch_results(db: AsyncSession, batch_id: str, model) -> int:
+    """Write embeddings from a completed batch job back to *model* rows.
+
+    Returns the number of rows updated; returns 0 without side effects while
+    the job is still running. search_text and content_hash are refreshed
+    alongside the embedding so backfilled rows join the dedup fast paths.
+    """
+    client = get_openai_client()
+    batch = await client.batches.retrieve(batch_id)
+    if batch.status in ("failed", "expired", "cancelled"):
+        # Terminal — no results are ever coming; resubmit the backfill.
+        logger.error("Batch %s terminally %s; no embeddings to fetch", batch_id, batch.status)
+        return 0
+    if batch.status != "completed":
+        logger.info("Batch %s not ready yet (status=%s)", batch_id, batch.status)
+        return 0
+
+    output = await client.files.content(batch.output_file_id)
+    embeddings_by_id: dict[uuid.UUID, list[float]] = {}
+    failed_lines = 0
+    for line in output.text.splitlines():
+        if not line:
+            continue
+        record = json.loads(line)
+        # A completed batch can still carry per-line failures: response is
+        # null and an error object is set instead. Write back the rows that
+        # succeeded; the failed ones keep a NULL embedding and are picked up
+        # by the next backfill submission.
+        response = record.get("response")
+        if record.get("error") or not response or response.get("status_code") != 200:
+            failed_lines += 1
+            logger.warning(
+                "Batch %s line for %s failed: %s",
+                batch_id, record.get("custom_id"),
+                record.get("error") or (response or {}).get("status_code"),
+            )
+            continue
+        body = response["body"]
+        embeddings_by_id[uuid.UUID(record["custom_id"])] = body["data"][0]["embedding"]
+    if failed_lines:
+        logger.warning("Batch %s: %d of its lines failed", batch_id, failed_lines)
+
+    result = await db.execute(select(model).where(model.id.in_(embeddings_by_id)))
+    count = 0
+    for row in result.scalars():
+        row.embedding = embeddings_by_id[row.id]
+        embed_input = _embed_input(row)
+        row.search_text = embed_input[:200]
+        row.content_hash = hashlib.blake2b(embed_input.encode(), digest_size=16).digest()
+        count += 1
+    await db.commit()
+    return count
@@ -2,7 +2,7 @@
 
 from ._docx import generate_docx
 from ._fitting import _compute_page_limits, _soft_trim_bullet
-from ._latex import generate_latex
+from ._latex import clear_caches, generate_latex
 from ._text import (
     _clean_bullet_text,
     _clean_location,
@@ -28,4 +28,5 @@ __all__ = [
     "_is_meaningful_bullet",
     "_normalize_bullets",
     "_soft_trim_bullet",
+    "clear_caches",
 ]
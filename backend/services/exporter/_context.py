@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import uuid
 
-from sqlalchemy import select
+from sqlalchemy import Text, cast, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from backend.api.db_helpers import fetch_latest_profile
+from backend.models.database import async_session
 from backend.models.tables import (
     Activity,
     CvVersion,
@@ -25,20 +28,158 @@ from ._fitting import (
     _fit_content_to_page,
 )
 from ._text import (
+    _clean_bullet_text,
     _dedupe_preserve_order,
     _format_date,
     _normalize_bullets,
 )
 
 
+# DB category values → LaTeX section keys; anything unlisted keeps its
+# capitalized form (e.g. "Certification").
+_CATEGORY_ALIASES = {
+    "Language": "Technical",
+    "Tool": "Technical",
+    "Other": "Technical",
+    "Interest": "Interests",
+}
+
+
+def _coerce_str_list(value, dict_key: str = "items") -> list[str]:
+    """Coerce a JSONB field to a stripped list of strings.
+
+    Handles the shapes the parser and manual edits produce: a plain list, a
+    dict wrapping the list under ``dict_key``, or a comma-separated string.
+    Anything else coerces to an empty list.
+    """
+    if isinstance(value, list):
+        return [s for s in (str(item).strip() for item in value) if s]
+    if isinstance(value, dict):
+        return _coerce_str_list(value.get(dict_key, []))
+    if isinstance(value, str):
+        return [s for s in (part.strip() for part in value.split(",")) if s]
+    return []
+
+
 async def _build_cv_context(
     db: AsyncSession,
     cv_version: CvVersion,
     user_id: uuid.UUID,
 ) -> dict:
     """Build the template context dict from a CvVersion and its referenced records."""
-    # Profile
-    profile_row = await fetch_latest_profile(db, user_id)
+    exp_ids = cv_version.selected_experiences or []
+    edu_ids = cv_version.selected_education or []
+    proj_ids = cv_version.selected_projects or []
+    act_ids = cv_version.selected_activities or []
+    skill_ids = cv_version.selected_skills or []
+
+    async def _fetch_rows(stmt):
+        # Read-only fetch on its own pooled session — a single AsyncSession
+        # serializes its statements, so separate sessions are what let the
+        # gather below overlap the round-trips.
+        async with async_session() as session:
+            return (await session.execute(stmt)).scalars().all()
+
+    async def _no_rows():
+        return []
+
+    # Rows beyond the largest per-section cap _compute_page_limits can ever
+    # return (the 2-page limits) can't appear on the CV, so cap them in SQL
+    # instead of fetching every selected row and slicing in Python. The
+    # profile row (and with it max_pages) arrives concurrently, so these
+    # bounds are pessimistic rather than page-count-aware.
+    _MAX_EXP_ROWS = 12
+    _MAX_PROJ_ROWS = 8
+    _MAX_ACT_ROWS = 6
+
+    def _projects_stmt():
+        # Deduplicate by name in SQL (DISTINCT ON) so duplicate rows never
+        # leave the database; blank/NULL names fall back to the row id so
+        # unnamed projects are never collapsed into each other. Ordering by
+        # date inside each name group keeps the most recent duplicate, same
+        # as the old Python-side first-seen check over date-sorted rows.
+        dedup_key = func.coalesce(
+            func.nullif(func.lower(func.btrim(Project.name)), ""),
+            cast(Project.id, Text),
+        )
+        deduped = (
+            select(Project)
+            .where(Project.id.in_(proj_ids), Project.user_id == user_id)
+            .order_by(dedup_key, Project.date_start.desc().nullslast())
+            .distinct(dedup_key)
+            .subquery()
+        )
+        proj = aliased(Project, deduped)
+        return (
+            select(proj)
+            .order_by(deduped.c.date_start.desc().nullslast())
+            .limit(_MAX_PROJ_ROWS)
+        )
+
+    # Six independent reads: wall time is the slowest query, not the sum.
+    # The profile fetch keeps the caller's session (its only statement here).
+    profile_row, exp_rows, edu_rows, proj_rows, act_rows, skill_rows = await asyncio.gather(
+        fetch_latest_profile(db, user_id),
+        _fetch_rows(
+            select(WorkExperience)
+            .where(WorkExperience.id.in_(exp_ids), WorkExperience.user_id == user_id)
+            .order_by(WorkExperience.date_start.desc().nullslast())
+            .limit(_MAX_EXP_ROWS)
+        ) if exp_ids else _no_rows(),
+        _fetch_rows(
+            select(Education).where(Education.id.in_(edu_ids), Education.user_id == user_id)
+        ) if edu_ids else _no_rows(),
+        _fetch_rows(_projects_stmt()) if proj_ids else _no_rows(),
+        _fetch_rows(
+            select(Activity)
+            .where(Activity.id.in_(act_ids), Activity.user_id == user_id)
+            .order_by(Activity.date_start.desc().nullslast())
+            .limit(_MAX_ACT_ROWS)
+        ) if act_ids else _no_rows(),
+        _fetch_rows(
+            select(Skill).where(Skill.id.in_(skill_ids), Skill.user_id == user_id)
+        ) if skill_ids else _no_rows(),
+    )
+
+    # Override dicts read once — not per row, where `or {}` allocated a fresh
+    # dict every iteration when the column is NULL.
+    final_cv = cv_version.final_cv_json or {}
+    accepted = cv_version.accepted_changes or {}
+
+    def _by_uuid(overrides: dict) -> dict[uuid.UUID, object]:
+        """Reindex override entries by parsed UUID.
+
+        Override keys arrive from the API as dashed UUID strings; reparsing
+        them once here lets the row loops look up ``row.id`` directly instead
+        of stringifying every UUID. Prefixed entries ("education_*",
+        "skills_*") are not UUIDs and stay in the string-keyed dicts.
+        """
+        out: dict[uuid.UUID, object] = {}
+        for key, value in overrides.items():
+            try:
+                out[uuid.UUID(key)] = value
+            except (TypeError, ValueError, AttributeError):
+                continue
+        return out
+
+    accepted_by_id = _by_uuid(accepted)
+    final_by_id = _by_uuid(final_cv)
+    _missing = object()
+
+    def _resolve_bullets(row_id: uuid.UUID, fallback_bullets, cap: int) -> list:
+        """Bullets for one row: accepted_changes wins, then final_cv_json,
+        then the row's own stored bullets; normalized and capped."""
+        bullets = accepted_by_id.get(row_id, _missing)
+        if bullets is _missing:
+            bullets = final_by_id.get(row_id, _missing)
+        if bullets is _missing:
+            bullets = extract_bullet_texts(fallback_bullets)
+        elif isinstance(bullets, dict):
+            bullets = bullets.get("bullets", [])
+        if isinstance(bullets, list):
+            return _normalize_bullets(bullets)[:cap]
+        return []
+
     profile = {}
     if profile_row:
         profile = {
@@ -57,97 +198,45 @@ async def _build_cv_context(
 
     # Work experiences — sorted by date descending (most recent first)
     experiences = []
-    exp_ids = cv_version.selected_experiences or []
-    if exp_ids:
-        result = await db.execute(
-            select(WorkExperience)
-            .where(
-                WorkExperience.id.in_(exp_ids),
-                WorkExperience.user_id == user_id,
-            )
-            .order_by(WorkExperience.date_start.desc().nullslast())
-        )
-        for exp in result.scalars().all():
-            exp_id_str = str(exp.id)
-            final_cv = cv_version.final_cv_json or {}
-            accepted = cv_version.accepted_changes or {}
-
-            if exp_id_str in accepted:
-                bullets = accepted[exp_id_str]
-                if isinstance(bullets, dict):
-                    bullets = bullets.get("bullets", [])
-            elif exp_id_str in final_cv:
-                bullets = final_cv[exp_id_str]
-                if isinstance(bullets, dict):
-                    bullets = bullets.get("bullets", [])
-            else:
-                bullets = extract_bullet_texts(exp.bullets)
-
-            if isinstance(bullets, list):
-                bullets = _normalize_bullets(bullets)
-            bullets = bullets[:bullet_cap_exp] if isinstance(bullets, list) else []
-
+    if exp_rows:
+        for exp in exp_rows:
             experiences.append({
                 "company": exp.company,
                 "role_title": exp.role_title,
                 "location": exp.location,
                 "date_start": _format_date(exp.date_start),
                 "date_end": "Present" if exp.is_current else _format_date(exp.date_end),
-                "bullets": bullets if isinstance(bullets, list) else [],
+                "bullets": _resolve_bullets(exp.id, exp.bullets, bullet_cap_exp),
             })
 
     # Education
     education = []
-    edu_ids = cv_version.selected_education or []
-    accepted = cv_version.accepted_changes or {}
-    if edu_ids:
-        result = await db.execute(
-            select(Education).where(
-                Education.id.in_(edu_ids),
-                Education.user_id == user_id,
-            )
-        )
-        for edu in result.scalars().all():
+    if edu_rows:
+        for edu in edu_rows:
             edu_id_str = str(edu.id)
 
             if f"education_{edu_id_str}" in accepted:
                 manual_items = accepted[f"education_{edu_id_str}"]
                 if isinstance(manual_items, dict):
-                    achievements = manual_items.get("achievements", [])
-                    modules = manual_items.get("modules", [])
-                    if isinstance(achievements, str):
-                        achievements = [a.strip() for a in achievements.split(",") if a.strip()]
-                    if isinstance(modules, str):
-                        modules = [m.strip() for m in modules.split(",") if m.strip()]
+                    achievements = _coerce_str_list(manual_items.get("achievements", []))
+                    modules = _coerce_str_list(manual_items.get("modules", []))
                 elif isinstance(manual_items, list):
-                    achievements = manual_items[:2]
+                    achievements = _coerce_str_list(manual_items[:2])
                     modules = []
                 else:
                     achievements = []
                     modules = []
             else:
-                achievements = []
-                if isinstance(edu.achievements, list):
-                    achievements = edu.achievements
-                elif isinstance(edu.achievements, dict):
-                    achievements = edu.achievements.get("items", [])
-                elif isinstance(edu.achievements, str):
-                    achievements = [a.strip() for a in edu.achievements.split(",") if a.strip()]
-                modules = []
-                if isinstance(edu.modules, list):
-                    modules = edu.modules
-                elif isinstance(edu.modules, dict):
-                    modules = edu.modules.get("items", [])
-                elif isinstance(edu.modules, str):
-                    modules = [m.strip() for m in edu.modules.split(",") if m.strip()]
-
-            if isinstance(achievements, list):
-                achievements = [str(a).strip() for a in achievements if str(a).strip()]
-            if isinstance(modules, list):
-                modules = [str(m).strip() for m in modules if str(m).strip()]
+                achievements = _coerce_str_list(edu.achievements)
+                modules = _coerce_str_list(edu.modules)
+
+            # Cleaned here so the template's bullet pass doesn't have to
+            achievements = [
+                cleaned for a in achievements if (cleaned := _clean_bullet_text(a))
+            ]
             achievements_cap = 5 if max_pages >= 2 else 3
-            achievements = achievements[:achievements_cap] if isinstance(achievements, list) else []
-            modules = modules[:4] if isinstance(modules, list) else []
+            achievements = achievements[:achievements_cap]
+            modules = modules[:4]
 
             education.append({
                 "institution": edu.institution,
@@ -160,40 +249,11 @@ async def _build_cv_context(
                 "modules": modules,
             })
 
-    # Projects — sorted by date descending, deduplicated by name
+    # Projects — sorted by date descending, deduplicated by name in SQL
     projects = []
-    seen_proj_names: set[str] = set()
-    proj_ids = cv_version.selected_projects or []
-    if proj_ids:
-        result = await db.execute(
-            select(Project)
-            .where(Project.id.in_(proj_ids), Project.user_id == user_id)
-            .order_by(Project.date_start.desc().nullslast())
-        )
-        for proj in result.scalars().all():
-            name_lower = (proj.name or "").strip().lower()
-            if name_lower and name_lower in seen_proj_names:
-                continue
-            if name_lower:
-                seen_proj_names.add(name_lower)
-            proj_id_str = str(proj.id)
-            final_cv = cv_version.final_cv_json or {}
-            accepted = cv_version.accepted_changes or {}
-
-            if proj_id_str in accepted:
-                bullets = accepted[proj_id_str]
-                if isinstance(bullets, dict):
-                    bullets = bullets.get("bullets", [])
-            elif proj_id_str in final_cv:
-                bullets = final_cv[proj_id_str]
-                if isinstance(bullets, dict):
-                    bullets = bullets.get("bullets", [])
-            else:
-                bullets = extract_bullet_texts(proj.bullets)
-
-            if isinstance(bullets, list):
-                bullets = _normalize_bullets(bullets)
-            bullets = bullets[:3] if isinstance(bullets, list) else []
+    if proj_rows:
+        for proj in proj_rows:
+            bullets = _resolve_bullets(proj.id, proj.bullets, 3)
             if not bullets and proj.description:
                 bullets = split_description_to_bullets(proj.description)[:3]
 
@@ -203,57 +263,27 @@ async def _build_cv_context(
                 "url": proj.url,
                 "date_start": _format_date(proj.date_start),
                 "date_end": _format_date(proj.date_end),
-                "bullets": bullets if isinstance(bullets, list) else [],
+                "bullets": bullets,
                 "skill_tags": proj.skill_tags or [],
             })
 
     # Activities — sorted by date descending
     activities = []
-    act_ids = cv_version.selected_activities or []
-    if act_ids:
-        result = await db.execute(
-            select(Activity)
-            .where(Activity.id.in_(act_ids), Activity.user_id == user_id)
-            .order_by(Activity.date_start.desc().nullslast())
-        )
-        for act in result.scalars().all():
-            act_id_str = str(act.id)
-            final_cv = cv_version.final_cv_json or {}
-            accepted = cv_version.accepted_changes or {}
-
-            if act_id_str in accepted:
-                bullets = accepted[act_id_str]
-                if isinstance(bullets, dict):
-                    bullets = bullets.get("bullets", [])
-            elif act_id_str in final_cv:
-                bullets = final_cv[act_id_str]
-                if isinstance(bullets, dict):
-                    bullets = bullets.get("bullets", [])
-            else:
-                bullets = extract_bullet_texts(act.bullets)
-
-            if isinstance(bullets, list):
-                bullets = _normalize_bullets(bullets)
-            bullets = bullets[:bullet_cap_act] if isinstance(bullets, list) else []
-
+    if act_rows:
+        for act in act_rows:
             activities.append({
                 "organization": act.organization,
                 "role_title": act.role_title,
                 "location": act.location,
                 "date_start": _format_date(act.date_start),
                 "date_end": "Present" if act.is_current else _format_date(act.date_end),
-                "bullets": bullets if isinstance(bullets, list) else [],
+                "bullets": _resolve_bullets(act.id, act.bullets, bullet_cap_act),
             })
 
     # Skills grouped by category, preserving JD-relevance priority order
     skills_by_category: dict[str, list[str]] = {}
-    skill_ids = cv_version.selected_skills or []
-    accepted = cv_version.accepted_changes or {}
-    if skill_ids:
-        result = await db.execute(
-            select(Skill).where(Skill.id.in_(skill_ids), Skill.user_id == user_id)
-        )
-        skills_by_id = {skill.id: skill for skill in result.scalars().all()}
+    if skill_rows:
+        skills_by_id = {skill.id: skill for skill in skill_rows}
         seen_skills: set[str] = set()
         seen_categories: set[str] = set()
 
@@ -266,11 +296,7 @@ async def _build_cv_context(
                 continue
             seen_skills.add(name_lower)
             cat = (skill.category or "Other").capitalize()
-            # Normalise DB category values → LaTeX section keys
-            if cat in ("Language", "Tool", "Other"):
-                cat = "Technical"
-            elif cat == "Interest":
-                cat = "Interests"
+            cat = _CATEGORY_ALIASES.get(cat, cat)
 
             skill_key = f"skills_{cat}"
             if skill_key in accepted and cat not in seen_categories:
@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import time
 import uuid
+from collections import OrderedDict
+from pathlib import Path
 
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.models.tables import CvVersion
@@ -17,87 +23,12 @@ from ._text import (
     _escape_latex_url,
     _is_meaningful_bullet,
 )
+from ._text import clear_caches as _clear_text_caches
 
-# ── LaTeX preamble (Jake Gutierrez template) ─────────────────────────────────
-_PREAMBLE = r"""\documentclass[letterpaper,11pt]{article}
+_TEMPLATE_DIR = Path(__file__).resolve().parent / "templates"
 
-\usepackage[T1]{fontenc}
-\usepackage[utf8]{inputenc}
-\usepackage{latexsym}
-\usepackage[empty]{fullpage}
-\usepackage{titlesec}
-\usepackage{marvosym}
-\usepackage[usenames,dvipsnames]{color}
-\usepackage{verbatim}
-\usepackage{enumitem}
-\usepackage[hidelinks]{hyperref}
-\usepackage{fancyhdr}
-\usepackage[english]{babel}
-\usepackage{tabularx}
-
-\pagestyle{fancy}
-\fancyhf{}
-\fancyfoot{}
-\renewcommand{\headrulewidth}{0pt}
-\renewcommand{\footrulewidth}{0pt}
-
-\addtolength{\oddsidemargin}{-0.5in}
-\addtolength{\evensidemargin}{-0.5in}
-\addtolength{\textwidth}{1in}
-\addtolength{\topmargin}{-.5in}
-\addtolength{\textheight}{1.0in}
-
-\urlstyle{same}
-
-\raggedbottom
-\raggedright
-\setlength{\tabcolsep}{0in}
-
-% Sections formatting
-\titleformat{\section}{
-  \vspace{-4pt}\scshape\raggedright\large
-}{}{0em}{}[\color{black}\titlerule \vspace{-5pt}]
-
-% Custom commands
-\newcommand{\resumeItem}[1]{
-  \item\small{
-    {#1 \vspace{-2pt}}
-  }
-}
-
-\newcommand{\resumeSubheading}[4]{
-  \vspace{-2pt}\item
-    \begin{tabular*}{0.97\textwidth}[t]{l@{\extracolsep{\fill}}r}
-      \textbf{#1} & #2 \\
-      \textit{\small#3} & \textit{\small #4} \\
-    \end{tabular*}\vspace{-7pt}
-}
-
-\newcommand{\resumeSubSubheading}[2]{
-    \item
-    \begin{tabular*}{0.97\textwidth}{l@{\extracolsep{\fill}}r}
-      \textit{\small#1} & \textit{\small #2} \\
-    \end{tabular*}\vspace{-7pt}
-}
-
-\newcommand{\resumeProjectHeading}[2]{
-    \item
-    \begin{tabular*}{0.97\textwidth}{l@{\extracolsep{\fill}}r}
-      \small#1 & #2 \\
-    \end{tabular*}\vspace{-7pt}
-}
-
-\newcommand{\resumeSubItem}[1]{\resumeItem{#1}\vspace{-4pt}}
-
-\renewcommand\labelitemii{$\vcenter{\hbox{\tiny$\bullet$}}$}
-
-\newcommand{\resumeSubHeadingListStart}{\begin{itemize}[leftmargin=0.15in, label={}]}
-\newcommand{\resumeSubHeadingListEnd}{\end{itemize}}
-\newcommand{\resumeItemListStart}{\begin{itemize}}
-\newcommand{\resumeItemListEnd}{\end{itemize}\vspace{-5pt}}
-
-\begin{document}
-"""
+# Skill categories the template renders, in section order.
+_ALLOWED_SKILL_CATS = ("Technical", "Certification", "Interests")
 
 
 def _date_range(start: str, end: str) -> str:
@@ -106,27 +37,115 @@ def _date_range(start: str, end: str) -> str:
     return start or end or ""
 
 
-def _render_bullet(bullet: str) -> str | None:
-    """Clean, trim and escape one bullet. Returns None if the result is empty."""
-    cleaned = _clean_bullet_text(bullet)
-    trimmed = _trim_bullet(cleaned)
-    if not trimmed or not _is_meaningful_bullet(trimmed):
+def _prepare_bullet(
+    bullet: str,
+    _clean=_clean_bullet_text,
+    _meaningful=_is_meaningful_bullet,
+    _trim=_trim_bullet,
+    _escape=_escape_latex,
+) -> str | None:
+    """One fused pass per bullet: clean → meaningfulness check → trim → escape.
+
+    The whitespace cleanup must stay here: not every bullet arrives
+    pre-cleaned (the project description fallback doesn't), and the escape
+    table deletes raw newlines rather than spacing them, which would glue
+    words across line breaks. Meaningless text is rejected before any
+    trimming work; the helpers are bound as defaults so the per-bullet hot
+    loop does four local calls, not global lookups. Returns None when the
+    bullet should be dropped.
+    """
+    bullet = _clean(bullet)
+    if not bullet or not _meaningful(bullet):
         return None
-    return _escape_latex(trimmed)
+    trimmed = _trim(bullet)
+    if not trimmed:
+        return None
+    return _escape(trimmed)
+
+
+def _rendered_bullets(bullets: list) -> list[str]:
+    """Render a bullet list for the template, dropping entries that come out empty."""
+    return [rendered for bullet in bullets if (rendered := _prepare_bullet(bullet))]
+
+
+# The template uses \VAR{...} / \BLOCK{...} delimiters instead of Jinja's
+# default {{ }} / {% %}, which collide with TeX's braces. The environment and
+# compiled template are built once at import and reused across requests; the
+# on-disk bytecode cache makes even the first render after a cold start skip
+# template compilation.
+_ENV = Environment(
+    loader=FileSystemLoader(_TEMPLATE_DIR),
+    autoescape=False,
+    block_start_string=r"\BLOCK{",
+    block_end_string="}",
+    variable_start_string=r"\VAR{",
+    variable_end_string="}",
+    comment_start_string=r"\COMMENT{",
+    comment_end_string="}",
+    trim_blocks=True,
+    lstrip_blocks=True,
+    auto_reload=False,
+    bytecode_cache=FileSystemBytecodeCache(),
+)
+_ENV.filters["tex"] = _escape_latex
+_ENV.filters["texurl"] = _escape_latex_url
+_ENV.filters["daterange"] = _date_range
+_ENV.filters["cleanloc"] = _clean_location
+_ENV.filters["cleanbullet"] = _clean_bullet_text
+_ENV.filters["bullets"] = _rendered_bullets
+
+_TEMPLATE = _ENV.get_template("jake_resume.tex.j2")
+
+# Rendered-LaTeX cache so back-to-back preview/download of the same version
+# doesn't rebuild the context and re-render. Keyed by the version id plus a
+# digest of its render-relevant fields, so accepting or resetting changes
+# invalidates immediately. The source rows (profile, experiences, …) carry
+# no updated_at to fold into the key, so entries also expire after a short
+# TTL rather than serving indefinitely stale output after a section edit.
+_LATEX_CACHE: OrderedDict[tuple[uuid.UUID, bytes], tuple[float, str]] = OrderedDict()
+_LATEX_CACHE_MAX = 256
+_LATEX_CACHE_TTL = 60.0
+
+
+def _latex_cache_key(cv_version: CvVersion) -> tuple[uuid.UUID, bytes]:
+    state = json.dumps(
+        {
+            "accepted": cv_version.accepted_changes,
+            "final": cv_version.final_cv_json,
+            "selected": [
+                [str(i) for i in ids or []]
+                for ids in (
+                    cv_version.selected_experiences,
+                    cv_version.selected_education,
+                    cv_version.selected_projects,
+                    cv_version.selected_activities,
+                    cv_version.selected_skills,
+                )
+            ],
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return (cv_version.id, hashlib.blake2b(state.encode(), digest_size=16).digest())
+
+
+def clear_caches() -> None:
+    """Reset the rendered-LaTeX cache and the memoized field helpers."""
+    _LATEX_CACHE.clear()
+    _clear_text_caches()
 
 
 async def generate_latex(db: AsyncSession, cv_version: CvVersion, user_id: uuid.UUID) -> str:
     """Generate LaTeX source (not compiled PDF) from the final CV data."""
+    key = _latex_cache_key(cv_version)
+    cached = _LATEX_CACHE.get(key)
+    if cached is not None and cached[0] > time.monotonic():
+        _LATEX_CACHE.move_to_end(key)
+        return cached[1]
+
     context = await _build_cv_context(db, cv_version, user_id)
     profile = context["profile"]
 
-    lines: list[str] = [_PREAMBLE]
-
-    # ── Header ───────────────────────────────────────────────────────────────
-    name = _escape_latex(profile.get("name", "Your Name"))
-    lines.append(r"\begin{center}")
-    lines.append(f"    \\textbf{{\\Huge \\scshape {name}}} \\\\ \\vspace{{1pt}}")
-
     contact_items = []
     if phone := profile.get("phone"):
         contact_items.append(f"\\small {_escape_latex(phone)}")
@@ -147,124 +166,21 @@ async def generate_latex(db: AsyncSession, cv_version: CvVersion, user_id: uuid.
     if location := profile.get("location"):
         contact_items.append(_escape_latex(location))
 
-    lines.append("    \\small " + " $|$ ".join(contact_items))
-    lines.append(r"\end{center}")
-    lines.append("")
-
-    # ── Education ────────────────────────────────────────────────────────────
-    if context["education"]:
-        lines.append(r"\section{Education}")
-        lines.append(r"  \resumeSubHeadingListStart")
-        for edu in context["education"]:
-            degree = _escape_latex(edu.get("degree", "Degree"))
-            institution = _escape_latex(edu.get("institution", "Institution"))
-            dates = _date_range(edu.get("date_start", ""), edu.get("date_end", ""))
-            location_str = _escape_latex(_clean_location(edu.get("location", "")))
-            lines.append(f"    \\resumeSubheading{{{institution}}}{{{dates}}}{{{degree}}}{{{location_str}}}")
-
-            if edu.get("achievements") or edu.get("modules"):
-                lines.append(r"      \resumeItemListStart")
-                for ach in edu.get("achievements", []):
-                    if rendered := _render_bullet(ach):
-                        lines.append(f"        \\resumeItem{{{rendered}}}")
-                if edu.get("modules"):
-                    modules_escaped = _escape_latex(_clean_bullet_text(", ".join(edu["modules"])))
-                    lines.append(f"        \\resumeItem{{\\textbf{{Coursework:}} {modules_escaped}}}")
-                lines.append(r"      \resumeItemListEnd")
-
-        lines.append(r"  \resumeSubHeadingListEnd")
-        lines.append("")
-
-    # ── Work Experience ───────────────────────────────────────────────────────
-    if context["experiences"]:
-        lines.append(r"\section{Experience}")
-        lines.append(r"  \resumeSubHeadingListStart")
-        for exp in context["experiences"]:
-            role = _escape_latex(exp.get("role_title", "Role"))
-            company = _escape_latex(exp.get("company", "Company"))
-            dates = _date_range(exp.get("date_start", ""), exp.get("date_end", ""))
-            location_str = _escape_latex(_clean_location(exp.get("location", "")))
-            lines.append(f"    \\resumeSubheading{{{company}}}{{{dates}}}{{{role}}}{{{location_str}}}")
-
-            if exp.get("bullets"):
-                lines.append(r"      \resumeItemListStart")
-                for bullet in exp["bullets"]:
-                    if rendered := _render_bullet(bullet):
-                        lines.append(f"        \\resumeItem{{{rendered}}}")
-                lines.append(r"      \resumeItemListEnd")
-
-        lines.append(r"  \resumeSubHeadingListEnd")
-        lines.append("")
-
-    # ── Projects ─────────────────────────────────────────────────────────────
-    if context["projects"]:
-        lines.append(r"\section{Projects}")
-        lines.append(r"    \resumeSubHeadingListStart")
-        for proj in context["projects"]:
-            name_str = _escape_latex(proj.get("name", "Project"))
-            dates = _date_range(proj.get("date_start", ""), proj.get("date_end", ""))
-            skill_tags = proj.get("skill_tags", [])
-            if skill_tags:
-                tech_str = _escape_latex(", ".join(skill_tags[:4]))
-                title = f"\\textbf{{{name_str}}} $|$ \\emph{{{tech_str}}}"
-            else:
-                title = f"\\textbf{{{name_str}}}"
-            lines.append(f"      \\resumeProjectHeading{{{title}}}{{{dates}}}")
-
-            if proj.get("bullets"):
-                lines.append(r"          \resumeItemListStart")
-                for bullet in proj["bullets"]:
-                    if rendered := _render_bullet(bullet):
-                        lines.append(f"            \\resumeItem{{{rendered}}}")
-                lines.append(r"          \resumeItemListEnd")
-
-        lines.append(r"    \resumeSubHeadingListEnd")
-        lines.append("")
-
-    # ── Leadership & Activities ───────────────────────────────────────────────
-    if context["activities"]:
-        lines.append(r"\section{Leadership \& Activities}")
-        lines.append(r"  \resumeSubHeadingListStart")
-        for act in context["activities"]:
-            role = _escape_latex(act.get("role_title", "Role"))
-            org = _escape_latex(act.get("organization", "Organization"))
-            dates = _date_range(act.get("date_start", ""), act.get("date_end", ""))
-            location_str = _escape_latex(_clean_location(act.get("location", "")))
-            lines.append(f"    \\resumeSubheading{{{role}}}{{{dates}}}{{{org}}}{{{location_str}}}")
-
-            if act.get("bullets"):
-                lines.append(r"      \resumeItemListStart")
-                for bullet in act["bullets"]:
-                    if rendered := _render_bullet(bullet):
-                        lines.append(f"        \\resumeItem{{{rendered}}}")
-                lines.append(r"      \resumeItemListEnd")
-
-        lines.append(r"  \resumeSubHeadingListEnd")
-        lines.append("")
-
-    # ── Technical Skills ──────────────────────────────────────────────────────
-    if context["skills_by_category"]:
-        lines.append(r"\section{Technical Skills}")
-        lines.append(r" \begin{itemize}[leftmargin=0.15in, label={}]")
-        lines.append(r"    \small{\item{")
-
-        allowed = ["Technical", "Certification", "Interests"]
-        categories = [
-            (c, context["skills_by_category"][c])
-            for c in allowed
-            if c in context["skills_by_category"]
-        ]
-        for i, (category, skill_list) in enumerate(categories):
-            cat_escaped = _escape_latex(category)
-            skills_escaped = ", ".join(_escape_latex(s) for s in skill_list)
-            line = f"     \\textbf{{{cat_escaped}}}{{: {skills_escaped}}}"
-            if i < len(categories) - 1:
-                line += " \\\\"
-            lines.append(line)
-
-        lines.append(r"    }}")
-        lines.append(r" \end{itemize}")
-        lines.append("")
-
-    lines.append(r"\end{document}")
-    return "\n".join(lines)
+    skills = context["skills_by_category"]
+    skill_categories = [(c, skills[c]) for c in _ALLOWED_SKILL_CATS if c in skills]
+
+    rendered = _TEMPLATE.render(
+        profile=profile,
+        contact_items=contact_items,
+        education=context["education"],
+        experiences=context["experiences"],
+        projects=context["projects"],
+        activities=context["activities"],
+        skill_categories=skill_categories,
+    )
+
+    _LATEX_CACHE[key] = (time.monotonic() + _LATEX_CACHE_TTL, rendered)
+    _LATEX_CACHE.move_to_end(key)
+    while len(_LATEX_CACHE) > _LATEX_CACHE_MAX:
+        _LATEX_CACHE.popitem(last=False)
+    return rendered
@@ -2,14 +2,29 @@
 
 from __future__ import annotations
 
+import re
 from datetime import date
+from functools import lru_cache
 
 
+# The same skill names, companies, locations and dates recur within one CV
+# and across a user's re-exports, so the field-level helpers are memoized —
+# a dict hit replaces the regex/strftime work on repeated values.
+
+
+# Fixed English month abbreviations — the CV always renders "%b %Y" style
+# dates, and a tuple index skips strftime's locale machinery and template
+# parse per call.
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+           "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+@lru_cache(maxsize=4096)
 def _format_date(d: date | str | None) -> str:
     if d is None:
         return ""
     if isinstance(d, date):
-        return d.strftime("%b %Y")
+        return f"{_MONTHS[d.month - 1]} {d.year}"
     return str(d)
 
 
@@ -26,6 +41,18 @@ def _clean_location(location: str | None) -> str:
     return location.rstrip(" ,;")
 
 
+# URL-unsafe characters → escaped forms; str.translate does the whole scan in
+# one C-level pass, and the common no-specials URL comes back untouched.
+_URL_TABLE = str.maketrans({
+    "\\": r"\textbackslash{}",
+    "{": r"\{",
+    "}": r"\}",
+    "%": r"\%",
+    "#": r"\#",
+})
+
+
+@lru_cache(maxsize=4096)
 def _escape_latex_url(url: str) -> str:
     """Escape characters that break LaTeX inside \\href{url} arguments.
 
@@ -34,13 +61,7 @@ def _escape_latex_url(url: str) -> str:
     """
     if not url:
         return ""
-    url = str(url)
-    url = url.replace("\\", r"\textbackslash{}")
-    url = url.replace("{", r"\{")
-    url = url.replace("}", r"\}")
-    url = url.replace("%", r"\%")
-    url = url.replace("#", r"\#")
-    return url
+    return str(url).translate(_URL_TABLE)
 
 
 # Unicode typography → ASCII equivalents (applied before LaTeX escaping so the
@@ -65,67 +86,93 @@ _UNICODE_TYPOGRAPHY = str.maketrans({
 })
 
 
+# Special LaTeX characters → escaped forms. Applied via str.translate, which
+# accepts multi-char replacement strings, so every special is rewritten in
+# one pass and replacements never see each other's output (which is what
+# forced the old sequential version to handle backslash first).
+_LATEX_SUB = {
+    "\\": r"\textbackslash{}",
+    "&": r"\&",
+    "%": r"\%",
+    "$": r"\$",
+    "#": r"\#",
+    "_": r"\_",
+    "{": r"\{",
+    "}": r"\}",
+    "~": r"\textasciitilde{}",
+    "^": r"\^{}",
+}
+
+# One fused table: strip control chars (all below 0x20 except tab), normalise
+# unicode typography to ASCII, and LaTeX-escape — a single C-level scan per
+# string. Merging is sound because the three domains are disjoint and the
+# typography replacements are plain ASCII with no LaTeX specials.
+_ESCAPE_TABLE = {
+    **{i: None for i in range(0x20) if i != 0x09},
+    **_UNICODE_TYPOGRAPHY,
+    **str.maketrans(_LATEX_SUB),
+}
+
+
+@lru_cache(maxsize=4096)
 def _escape_latex(text: str) -> str:
     """Escape special LaTeX characters."""
     if not text:
         return ""
-    text = str(text)
-    text = "".join(ch for ch in text if ch >= " " or ch == "\t")
-    # Normalise unicode typography to ASCII before LaTeX-escaping
-    text = text.translate(_UNICODE_TYPOGRAPHY)
-    text = text.replace("\\", r"\textbackslash{}")
-    for char, replacement in [
-        ("&", r"\&"),
-        ("%", r"\%"),
-        ("$", r"\$"),
-        ("#", r"\#"),
-        ("_", r"\_"),
-        ("{", r"\{"),
-        ("}", r"\}"),
-        ("~", r"\textasciitilde{}"),
-        ("^", r"\^{}"),
-    ]:
-        text = text.replace(char, replacement)
-    return text
+    return str(text).translate(_ESCAPE_TABLE)
 
 
 def _clean_bullet_text(text: str) -> str:
     """Remove newlines and collapse multiple spaces from bullet text."""
     if not text:
         return ""
-    text = str(text)
-    text = text.replace("\n", " ").replace("\r", " ").replace("\t", " ")
-    text = " ".join(text.split())
-    return text
+    # split()/join collapses whitespace runs and trims the ends in C,
+    # without entering the regex engine at all.
+    return " ".join(str(text).split())
+
+
+# Unicode-aware alphanumeric (word character minus underscore)
+_ALNUM_RE = re.compile(r"[^\W_]")
 
 
 def _is_meaningful_bullet(text: str) -> bool:
     """Return True if text has any alphanumeric content after cleanup."""
-    if not text:
-        return False
-    return any(ch.isalnum() for ch in text)
+    # One C-level scan that stops at the first alphanumeric, instead of a
+    # Python-level isalnum() call per character.
+    return bool(text) and _ALNUM_RE.search(text) is not None
 
 
 def _normalize_bullets(bullets: list) -> list[str]:
     """Normalize bullet list to clean text and drop empty entries."""
-    normalized: list[str] = []
-    for bullet in bullets:
-        if isinstance(bullet, dict):
-            bullet = bullet.get("text", "")
-        cleaned = _clean_bullet_text(bullet)
-        if _is_meaningful_bullet(cleaned):
-            normalized.append(cleaned)
-    return normalized
+    # Fused extract → clean → filter in one comprehension; the walrus keeps
+    # each bullet cleaned exactly once.
+    return [
+        cleaned
+        for bullet in bullets
+        if _is_meaningful_bullet(
+            cleaned := _clean_bullet_text(
+                bullet.get("text", "") if isinstance(bullet, dict) else bullet
+            )
+        )
+    ]
+
+
+def clear_caches() -> None:
+    """Reset the memoized field helpers (used by tests)."""
+    _escape_latex.cache_clear()
+    _escape_latex_url.cache_clear()
+    _format_date.cache_clear()
 
 
 def _dedupe_preserve_order(items: list[str]) -> list[str]:
     """Deduplicate strings while preserving order (case-insensitive)."""
-    seen: set[str] = set()
-    result: list[str] = []
+    # Insertion-ordered dict as the dedupe structure: one setdefault per item
+    # instead of a separate seen-set membership test plus list append, and
+    # the first occurrence's casing wins.
+    kept: dict[str, str] = {}
     for item in items:
-        key = item.strip().lower()
-        if not key or key in seen:
-            continue
-        seen.add(key)
-        result.append(item)
-    return result
+        # casefold rather than lower so e.g. "ß"/"SS" skills dedupe too
+        key = item.strip().casefold()
+        if key:
+            kept.setdefault(key, item)
+    return list(kept.values())
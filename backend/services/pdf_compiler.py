@@ -7,15 +7,56 @@ from CTAN and caches them locally.
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
+import os
 import tempfile
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 
+from backend.config import get_settings
+
 logger = logging.getLogger(__name__)
 
 # First compile downloads packages (~20s). Subsequent compiles use the local cache (~3-5s).
 _TIMEOUT_SECONDS = 120
 
+# Compiled-PDF cache keyed by source digest. Compilation is a pure function
+# of the LaTeX source, so preview-then-download of an unchanged CV skips the
+# whole engine run instead of paying the multi-second compile twice. A CV
+# PDF is ~100KB, so 64 entries is a few MB.
+_PDF_CACHE: OrderedDict[bytes, bytes] = OrderedDict()
+_PDF_CACHE_MAX = 64
+
+# Each compile is its own single-threaded CPU-bound tectonic process, so
+# concurrent exports already spread across cores; this bound just stops a
+# burst of requests from forking more engines than there are cores and
+# thrashing instead of queueing.
+_COMPILE_SEMAPHORE = asyncio.Semaphore(max(1, os.cpu_count() or 1))
+
+# Scratch space for tex/aux/log/pdf files. /dev/shm is RAM-backed tmpfs, so
+# Tectonic's intermediate writes never touch the (possibly network-backed)
+# disk; None falls back to the platform default /tmp.
+_SCRATCH_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+@lru_cache
+def _tectonic_env() -> dict[str, str] | None:
+    """Environment for the tectonic subprocess.
+
+    When TECTONIC_CACHE_DIR is configured, pin Tectonic's bundle cache to
+    that (persistent) path so CTAN packages and format files survive
+    container restarts instead of being re-downloaded on the first compile
+    of every fresh instance. None means inherit the parent environment.
+    """
+    cache_dir = get_settings().tectonic_cache_dir
+    if not cache_dir:
+        return None
+    path = Path(cache_dir)
+    path.mkdir(parents=True, exist_ok=True)
+    return {**os.environ, "TECTONIC_CACHE_DIR": str(path)}
+
 
 async def compile_latex_to_pdf(latex_content: str) -> bytes:
     """Compile LaTeX source to PDF bytes using Tectonic.
@@ -24,40 +65,54 @@ async def compile_latex_to_pdf(latex_content: str) -> bytes:
         FileNotFoundError: Tectonic binary not found — not installed on this server.
         RuntimeError: Compilation failed or timed out.
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tex_path = Path(tmpdir) / "cv.tex"
-        tex_path.write_text(latex_content, encoding="utf-8")
-
-        try:
-            proc = await asyncio.create_subprocess_exec(
-                "tectonic",
-                "--keep-logs",
-                "--outdir", tmpdir,
-                str(tex_path),
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-        except FileNotFoundError:
-            raise FileNotFoundError(
-                "Tectonic is not installed on this server. "
-                "Ensure tectonic is available in the container image to enable PDF export."
-            )
-
-        try:
-            _stdout, stderr = await asyncio.wait_for(
-                proc.communicate(), timeout=_TIMEOUT_SECONDS
-            )
-        except asyncio.TimeoutError:
-            proc.kill()
-            raise RuntimeError("PDF compilation timed out after 120 seconds")
-
-        if proc.returncode != 0:
-            stderr_text = stderr.decode(errors="replace")
-            logger.error("Tectonic compilation failed (rc=%d):\n%s", proc.returncode, stderr_text)
-            raise RuntimeError(f"PDF compilation failed: {stderr_text[:400]}")
-
-        pdf_path = Path(tmpdir) / "cv.pdf"
-        if not pdf_path.exists():
-            raise RuntimeError("PDF output not found after compilation")
-
-        return pdf_path.read_bytes()
+    digest = hashlib.blake2b(latex_content.encode(), digest_size=16).digest()
+    cached = _PDF_CACHE.get(digest)
+    if cached is not None:
+        _PDF_CACHE.move_to_end(digest)
+        return cached
+
+    async with _COMPILE_SEMAPHORE:
+        with tempfile.TemporaryDirectory(dir=_SCRATCH_DIR) as tmpdir:
+            tex_path = Path(tmpdir) / "cv.tex"
+            tex_path.write_bytes(latex_content.encode("utf-8"))
+
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    "tectonic",
+                    "--keep-logs",
+                    "--outdir", tmpdir,
+                    str(tex_path),
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    env=_tectonic_env(),
+                )
+            except FileNotFoundError:
+                raise FileNotFoundError(
+                    "Tectonic is not installed on this server. "
+                    "Ensure tectonic is available in the container image to enable PDF export."
+                )
+
+            try:
+                _stdout, stderr = await asyncio.wait_for(
+                    proc.communicate(), timeout=_TIMEOUT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                proc.kill()
+                raise RuntimeError("PDF compilation timed out after 120 seconds")
+
+            if proc.returncode != 0:
+                stderr_text = stderr.decode(errors="replace")
+                logger.error("Tectonic compilation failed (rc=%d):\n%s", proc.returncode, stderr_text)
+                raise RuntimeError(f"PDF compilation failed: {stderr_text[:400]}")
+
+            pdf_path = Path(tmpdir) / "cv.pdf"
+            if not pdf_path.exists():
+                raise RuntimeError("PDF output not found after compilation")
+
+            pdf_bytes = pdf_path.read_bytes()
+
+    _PDF_CACHE[digest] = pdf_bytes
+    _PDF_CACHE.move_to_end(digest)
+    while len(_PDF_CACHE) > _PDF_CACHE_MAX:
+        _PDF_CACHE.popitem(last=False)
+    return pdf_bytes
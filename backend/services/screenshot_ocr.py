@@ -2,12 +2,33 @@
 
 from __future__ import annotations
 
-import base64
+import binascii
+import hashlib
+import io
+import time
+from collections import OrderedDict
+
+from PIL import Image
 
 from backend.clients import get_openai_client
 from backend.config import get_settings
 from backend.utils import retry_openai
 
+_ACCEPTED_MEDIA_TYPES = ("image/png", "image/jpeg", "image/webp", "image/gif")
+
+# Screenshots are mostly whitespace; the model reads them just as well after
+# downscaling, and vision token cost scales with pixel area.
+_MAX_EDGE = 2048
+_JPEG_QUALITY = 85
+
+# Extracted-text cache keyed by a digest of the uploaded bytes. Retried and
+# re-submitted screenshots are byte-identical, so repeats skip the 1-3s
+# vision call (and its token cost) entirely. In-process like the other
+# service caches; entries expire after a day.
+_OCR_CACHE: OrderedDict[bytes, tuple[float, str]] = OrderedDict()
+_OCR_CACHE_MAX = 256
+_OCR_CACHE_TTL = 86400.0
+
 SYSTEM_PROMPT = """\
 You are an OCR assistant. The user will provide a screenshot image of a job description / job posting.
 Extract ALL text from the image exactly as it appears, preserving the structure (headings, bullet points, paragraphs).
@@ -17,11 +38,51 @@ If the image does not appear to contain a job description, return the text anywa
 """
 
 
+def _preprocess_screenshot(image_bytes: bytes, content_type: str) -> tuple[bytes, str, str]:
+    """Shrink a screenshot before the vision call.
+
+    Resizes the longest edge to 2048px and recompresses as JPEG (alpha
+    flattened onto white), which cuts input tokens roughly in half on
+    typical full-page captures. Small images get "low" detail — they fit in
+    a single vision tile anyway. Unreadable bytes pass through untouched so
+    the API produces the error message, not us.
+
+    Returns (bytes, media_type, detail).
+    """
+    try:
+        img = Image.open(io.BytesIO(image_bytes))
+        img.load()
+    except Exception:
+        media_type = content_type if content_type in _ACCEPTED_MEDIA_TYPES else "image/png"
+        return image_bytes, media_type, "auto"
+
+    if img.mode in ("RGBA", "LA", "PA") or (img.mode == "P" and "transparency" in img.info):
+        background = Image.new("RGB", img.size, (255, 255, 255))
+        background.paste(img.convert("RGBA"), mask=img.convert("RGBA").getchannel("A"))
+        img = background
+    elif img.mode != "RGB":
+        img = img.convert("RGB")
+
+    img.thumbnail((_MAX_EDGE, _MAX_EDGE), Image.LANCZOS)
+    buf = io.BytesIO()
+    img.save(buf, "JPEG", quality=_JPEG_QUALITY, optimize=True)
+    detail = "low" if max(img.size) <= 768 else "high"
+    return buf.getvalue(), "image/jpeg", detail
+
+
 @retry_openai()
 async def extract_text_from_screenshot(image_bytes: bytes, content_type: str) -> str:
     """Send a screenshot to GPT-4o Vision and return extracted text."""
-    b64 = base64.b64encode(image_bytes).decode("utf-8")
-    media_type = content_type if content_type in ("image/png", "image/jpeg", "image/webp", "image/gif") else "image/png"
+    digest = hashlib.blake2b(image_bytes, digest_size=16).digest()
+    cached = _OCR_CACHE.get(digest)
+    if cached is not None and cached[0] > time.monotonic():
+        _OCR_CACHE.move_to_end(digest)
+        return cached[1]
+
+    image_bytes, media_type, detail = _preprocess_screenshot(image_bytes, content_type)
+    # b2a_base64 skips base64's column-wrapping logic, and the ascii decode
+    # is the fast path for data known to be 7-bit.
+    b64 = binascii.b2a_base64(image_bytes, newline=False).decode("ascii")
 
     client = get_openai_client()
     settings = get_settings()
@@ -35,7 +96,7 @@ async def extract_text_from_screenshot(image_bytes: bytes, content_type: str) ->
                     {"type": "text", "text": "Extract all text from this job description screenshot:"},
                     {
                         "type": "image_url",
-                        "image_url": {"url": f"data:{media_type};base64,{b64}"},
+                        "image_url": {"url": f"data:{media_type};base64,{b64}", "detail": detail},
                     },
                 ],
             },
@@ -44,4 +105,10 @@ async def extract_text_from_screenshot(image_bytes: bytes, content_type: str) ->
         max_tokens=4096,
     )
 
-    return response.choices[0].message.content.strip()
+    text = response.choices[0].message.content.strip()
+
+    _OCR_CACHE[digest] = (time.monotonic() + _OCR_CACHE_TTL, text)
+    _OCR_CACHE.move_to_end(digest)
+    while len(_OCR_CACHE) > _OCR_CACHE_MAX:
+        _OCR_CACHE.popitem(last=False)
+    return text
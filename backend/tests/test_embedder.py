@@ -0,0 +1,69 @@
+"""Tests for the embedder's in-process cache."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from backend.services import embedder
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Each test starts and ends with an empty L1 cache."""
+    embedder._cache.clear()
+    yield
+    embedder._cache.clear()
+
+
+def _fake_openai(calls: list[list[str]]):
+    async def fake_call(texts: list[str]) -> list[np.ndarray]:
+        calls.append(list(texts))
+        return [np.full(1536, float(len(t)), dtype=np.float32) for t in texts]
+
+    return fake_call
+
+
+class TestEmbedTextCache:
+    @pytest.mark.asyncio
+    async def test_embed_text_caches_second_call(self, monkeypatch):
+        calls: list[list[str]] = []
+        monkeypatch.setattr(embedder, "_call_openai_embeddings", _fake_openai(calls))
+
+        first = await embedder.embed_text("Built REST APIs with FastAPI")
+        second = await embedder.embed_text("Built REST APIs with FastAPI")
+
+        assert len(calls) == 1
+        assert np.array_equal(first, second)
+
+    @pytest.mark.asyncio
+    async def test_embed_texts_only_sends_cache_misses(self, monkeypatch):
+        calls: list[list[str]] = []
+        monkeypatch.setattr(embedder, "_call_openai_embeddings", _fake_openai(calls))
+
+        await embedder.embed_text("cached bullet")
+        results = await embedder.embed_texts(["cached bullet", "new bullet"])
+
+        assert len(results) == 2
+        assert calls[-1] == ["new bullet"]
+
+    @pytest.mark.asyncio
+    async def test_cache_key_ignores_whitespace_and_case(self, monkeypatch):
+        calls: list[list[str]] = []
+        monkeypatch.setattr(embedder, "_call_openai_embeddings", _fake_openai(calls))
+
+        await embedder.embed_text("Acme Corp  Backend Engineer")
+        await embedder.embed_text("acme corp backend engineer ")
+
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_embed_texts_dedupes_within_batch(self, monkeypatch):
+        calls: list[list[str]] = []
+        monkeypatch.setattr(embedder, "_call_openai_embeddings", _fake_openai(calls))
+
+        results = await embedder.embed_texts(["repeated", "unique", "repeated"])
+
+        assert calls == [["repeated", "unique"]]
+        assert len(results) == 3
+        assert np.array_equal(results[0], results[2])
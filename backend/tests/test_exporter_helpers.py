@@ -434,8 +434,9 @@ class TestEscapeLatexFuzz:
             "}": r"\}",
             "~": r"\textasciitilde{}",
             "^": r"\^{}",
-            # Backslash becomes \textbackslash{}, then { and } are escaped
-            "\\": r"\textbackslash\{\}",
+            # Single-pass escaping: the braces in \textbackslash{} are part of
+            # the replacement and must not themselves get escaped.
+            "\\": r"\textbackslash{}",
         }
         for char, expected in cases.items():
             result = _escape_latex(char)
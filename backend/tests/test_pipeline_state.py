@@ -8,6 +8,13 @@ from pydantic import ValidationError
 from backend.agents.graph import PipelineState
 
 
+# Built once: the default-value assertions only read attributes, so they
+# can share one instance instead of paying model construction 13 times.
+@pytest.fixture(scope="module")
+def default_state():
+    return PipelineState(application_id="a", user_id="u")
+
+
 class TestPipelineStateDefaults:
     """Verify PipelineState Pydantic model has correct defaults."""
 
@@ -16,57 +23,26 @@ class TestPipelineStateDefaults:
         assert state.application_id == "app-1"
         assert state.user_id == "user-1"
 
-    def test_jd_raw_defaults_empty(self):
-        state = PipelineState(application_id="a", user_id="u")
-        assert state.jd_raw == ""
-
-    def test_jd_parsed_defaults_empty_dict(self):
-        state = PipelineState(application_id="a", user_id="u")
-        assert state.jd_parsed == {}
-
-    def test_selection_defaults_empty_dict(self):
-        state = PipelineState(application_id="a", user_id="u")
-        assert state.selection == {}
-
-    def test_gap_analysis_defaults_empty_dict(self):
-        state = PipelineState(application_id="a", user_id="u")
-        assert state.gap_analysis == {}
-
-    def test_tailored_experiences_defaults_empty_list(self):
-        state = PipelineState(application_id="a", user_id="u")
-        assert state.tailored_experiences == []
-
-    def test_tailored_projects_defaults_empty_list(self):
-        state = PipelineState(application_id="a", user_id="u")
-        assert state.tailored_projects == []
-
-    def test_tailored_activities_defaults_empty_list(self):
-        state = PipelineState(application_id="a", user_id="u")
-        assert state.tailored_activities == []
-
-    def test_ats_result_defaults_empty_dict(self):
-        state = PipelineState(application_id="a", user_id="u")
-        assert state.ats_result == {}
-
-    def test_cv_version_id_defaults_empty(self):
-        state = PipelineState(application_id="a", user_id="u")
-        assert state.cv_version_id == ""
-
-    def test_current_step_defaults_pending(self):
-        state = PipelineState(application_id="a", user_id="u")
-        assert state.current_step == "pending"
-
-    def test_error_defaults_none(self):
-        state = PipelineState(application_id="a", user_id="u")
-        assert state.error is None
-
-    def test_max_pages_defaults_1(self):
-        state = PipelineState(application_id="a", user_id="u")
-        assert state.max_pages == 1
-
-    def test_selection_mode_defaults_library(self):
-        state = PipelineState(application_id="a", user_id="u")
-        assert state.selection_mode == "library"
+    @pytest.mark.parametrize(
+        ("field", "expected"),
+        [
+            ("jd_raw", ""),
+            ("jd_parsed", {}),
+            ("selection", {}),
+            ("gap_analysis", {}),
+            ("tailored_experiences", []),
+            ("tailored_projects", []),
+            ("tailored_activities", []),
+            ("ats_result", {}),
+            ("cv_version_id", ""),
+            ("current_step", "pending"),
+            ("error", None),
+            ("max_pages", 1),
+            ("selection_mode", "library"),
+        ],
+    )
+    def test_default(self, default_state, field, expected):
+        assert getattr(default_state, field) == expected
 
 
 class TestPipelineStateAssignment:
@@ -20,58 +20,68 @@ def _make_rate_limit_error() -> openai.RateLimitError:
 
 
 # ── split_description_to_bullets ─────────────────────────────────────────────
+# Plain functions — no shared fixtures or state, so no class wrapper to
+# instantiate per test.
 
-class TestSplitDescriptionToBullets:
-    def test_empty_string(self):
-        assert split_description_to_bullets("") == []
-
-    def test_none_returns_empty(self):
-        assert split_description_to_bullets(None) == []  # type: ignore[arg-type]
-
-    def test_whitespace_only(self):
-        assert split_description_to_bullets("   ") == []
-
-    def test_single_sentence(self):
-        result = split_description_to_bullets("Built REST APIs using FastAPI.")
-        assert result == ["Built REST APIs using FastAPI."]
-
-    def test_two_sentences(self):
-        result = split_description_to_bullets(
-            "Built REST APIs using FastAPI. Reduced latency by 40%."
-        )
-        assert len(result) == 2
-        assert result[0] == "Built REST APIs using FastAPI."
-        assert result[1] == "Reduced latency by 40%."
-
-    def test_three_sentences(self):
-        result = split_description_to_bullets(
-            "Designed the database. Built the API. Deployed to AWS."
-        )
-        assert len(result) == 3
-
-    def test_strips_leading_trailing_whitespace(self):
-        result = split_description_to_bullets(
-            "  Sentence one.  Sentence two.  "
-        )
-        for s in result:
-            assert s == s.strip()
-
-    def test_sentence_starting_lowercase_not_split(self):
-        # Split only on ". [UpperCase]", so "e.g. something" stays together
-        text = "Used Python e.g. for scripting. Deployed to AWS."
-        result = split_description_to_bullets(text)
-        # Should have 2 parts, not split at "e.g."
-        assert len(result) == 2
-
-    def test_no_period_single_bullet(self):
-        text = "Built APIs using FastAPI and deployed to AWS"
-        result = split_description_to_bullets(text)
-        assert result == [text]
-
-    def test_filters_empty_parts(self):
-        # Edge case: trailing period doesn't create empty bullet
-        result = split_description_to_bullets("Did something.")
-        assert all(s.strip() for s in result)
+def test_empty_string():
+    assert split_description_to_bullets("") == []
+
+
+def test_none_returns_empty():
+    assert split_description_to_bullets(None) == []  # type: ignore[arg-type]
+
+
+def test_whitespace_only():
+    assert split_description_to_bullets("   ") == []
+
+
+def test_single_sentence():
+    result = split_description_to_bullets("Built REST APIs using FastAPI.")
+    assert result == ["Built REST APIs using FastAPI."]
+
+
+def test_two_sentences():
+    result = split_description_to_bullets(
+        "Built REST APIs using FastAPI. Reduced latency by 40%."
+    )
+    assert len(result) == 2
+    assert result[0] == "Built REST APIs using FastAPI."
+    assert result[1] == "Reduced latency by 40%."
+
+
+def test_three_sentences():
+    result = split_description_to_bullets(
+        "Designed the database. Built the API. Deployed to AWS."
+    )
+    assert len(result) == 3
+
+
+def test_strips_leading_trailing_whitespace():
+    result = split_description_to_bullets(
+        "  Sentence one.  Sentence two.  "
+    )
+    for s in result:
+        assert s == s.strip()
+
+
+def test_sentence_starting_lowercase_not_split():
+    # Split only on ". [UpperCase]", so "e.g. something" stays together
+    text = "Used Python e.g. for scripting. Deployed to AWS."
+    result = split_description_to_bullets(text)
+    # Should have 2 parts, not split at "e.g."
+    assert len(result) == 2
+
+
+def test_no_period_single_bullet():
+    text = "Built APIs using FastAPI and deployed to AWS"
+    result = split_description_to_bullets(text)
+    assert result == [text]
+
+
+def test_filters_empty_parts():
+    # Edge case: trailing period doesn't create empty bullet
+    result = split_description_to_bullets("Did something.")
+    assert all(s.strip() for s in result)
 
 
 # ── retry_openai ──────────────────────────────────────────────────────────────
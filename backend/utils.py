@@ -3,9 +3,8 @@
 from __future__ import annotations
 
 import asyncio
-import functools
 import logging
-import re
+from collections.abc import Iterator
 from typing import TypeVar
 
 import openai
@@ -15,6 +14,7 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
+
 def retry_openai(
     max_retries: int = 3,
     backoff: float = 1.0,
@@ -24,38 +24,95 @@ def retry_openai(
     Retries on RateLimitError and APITimeoutError with exponential backoff.
     """
     def decorator(fn):
-        @functools.wraps(fn)
+        # Backoff schedule fixed at decoration time — nothing to recompute
+        # in the retry loop.
+        waits = tuple(backoff * (1 << i) for i in range(max_retries))
+        sleep = asyncio.sleep
+        fn_name = fn.__name__
+
         async def wrapper(*args, **kwargs):
             last_exc = None
-            for attempt in range(max_retries):
+            for attempt, wait in enumerate(waits):
                 try:
                     return await fn(*args, **kwargs)
                 except (openai.RateLimitError, openai.APITimeoutError) as exc:
                     last_exc = exc
-                    wait = backoff * (2 ** attempt)
-                    logger.warning(
-                        "OpenAI %s on attempt %d/%d for %s — retrying in %.1fs",
-                        type(exc).__name__, attempt + 1, max_retries, fn.__name__, wait,
-                    )
-                    await asyncio.sleep(wait)
+                    # Gate on level so a filtered-out warning costs one
+                    # check instead of building the five-arg tuple.
+                    if logger.isEnabledFor(logging.WARNING):
+                        logger.warning(
+                            "OpenAI %s on attempt %d/%d for %s — retrying in %.1fs",
+                            exc.__class__.__name__, attempt + 1, max_retries, fn_name, wait,
+                        )
+                    # sleep(0) short-circuits to a bare yield — no event-loop
+                    # timer — which matters for backoff=0 callers and the
+                    # near-zero backoffs the retry tests use.
+                    await sleep(wait if wait > 0 else 0)
             raise last_exc  # type: ignore[misc]
+
+        # Just the identity attributes (for log lines and tracebacks) —
+        # functools.wraps would also wire up __wrapped__/__dict__, which
+        # nothing here uses.
+        wrapper.__name__ = fn.__name__
+        wrapper.__qualname__ = fn.__qualname__
+        wrapper.__doc__ = fn.__doc__
         return wrapper
     return decorator
 
 
+# Shared empty result for the common no-bullets case — saves a list
+# allocation per call. Callers treat the return as read-only (they iterate,
+# unpack, or rebind), so handing out the same object is safe.
+_NO_BULLETS: list[str] = []
+
+
 def extract_bullet_texts(bullets_data) -> list[str]:
     """Extract plain text from a JSONB bullets field (list of dicts or strings)."""
-    if not bullets_data:
-        return []
-    if isinstance(bullets_data, list):
-        result = []
-        for b in bullets_data:
-            if isinstance(b, dict):
-                result.append(b.get("text", ""))
-            elif isinstance(b, str):
-                result.append(b)
-        return result
-    return []
+    if not bullets_data or not isinstance(bullets_data, list):
+        return _NO_BULLETS
+    # Identity checks rather than isinstance: decoded JSONB is always
+    # concretely dict or str, never a subclass, and `type(b) is dict` is a
+    # single pointer compare.
+    return [
+        b.get("text", "") if type(b) is dict else b
+        for b in bullets_data
+        if type(b) is dict or type(b) is str
+    ]
+
+
+def iter_description_bullets(description: str) -> Iterator[str]:
+    """Yield sentence bullets from a description one at a time.
+
+    Same boundary rule as split_description_to_bullets (period, whitespace,
+    uppercase letter) but streams the parts, for callers that only iterate.
+    """
+    if not description:
+        return
+    # Hand-rolled scan over the old lookbehind/lookahead regex
+    # (?<=\.)\s+(?=[A-Z]): str.find jumps between periods at C speed instead
+    # of the regex engine testing every position. Boundary = period, a
+    # whitespace run, then an ASCII uppercase letter (matching [A-Z]).
+    text = description.strip()
+    n = len(text)
+    find = text.find
+    start = 0
+    i = 0
+    while True:
+        dot = find(".", i)
+        if dot < 0:
+            break
+        k = dot + 1
+        while k < n and text[k].isspace():
+            k += 1
+        if k > dot + 1 and k < n and "A" <= text[k] <= "Z":
+            part = text[start:dot + 1].strip()
+            if part:
+                yield part
+            start = k
+        i = k if k > dot + 1 else dot + 1
+    tail = text[start:].strip()
+    if tail:
+        yield tail
 
 
 def split_description_to_bullets(description: str) -> list[str]:
@@ -64,7 +121,12 @@ def split_description_to_bullets(description: str) -> list[str]:
     Splits on sentence boundaries (period followed by space and uppercase letter).
     Used consistently across tailoring and export to avoid mismatches.
     """
-    if not description or not description.strip():
+    if not description:
         return []
-    parts = re.split(r'(?<=\.)\s+(?=[A-Z])', description.strip())
-    return [p.strip() for p in parts if p.strip()]
+    # No period means no possible boundary — skip the scanner for the very
+    # common single-clause description. (Checking "." rather than ". "
+    # keeps period-plus-newline boundaries on the slow path.)
+    text = description.strip()
+    if "." not in text:
+        return [text] if text else []
+    return list(iter_description_bullets(text))
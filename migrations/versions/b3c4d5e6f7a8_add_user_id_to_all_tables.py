@@ -37,20 +37,33 @@ TABLES = [
 
 
 def upgrade() -> None:
-    # Step 1: Add nullable user_id column to all tables
+    # Adding the column NOT NULL with a server default lets Postgres 11+
+    # record the fill value as catalog metadata (attmissingval) — no per-row
+    # backfill UPDATE, no table rewrite, no WAL proportional to row count.
+    # The default is dropped right after so new rows must supply user_id.
     for table in TABLES:
-        op.add_column(table, sa.Column("user_id", UUID(as_uuid=True), nullable=True))
-
-    # Step 2: Backfill existing rows with placeholder UUID
-    for table in TABLES:
-        op.execute(
-            f"UPDATE {table} SET user_id = '{PLACEHOLDER_USER_ID}' WHERE user_id IS NULL"
+        op.add_column(
+            table,
+            sa.Column(
+                "user_id",
+                UUID(as_uuid=True),
+                nullable=False,
+                server_default=sa.text(f"'{PLACEHOLDER_USER_ID}'::uuid"),
+            ),
         )
+        op.alter_column(table, "user_id", server_default=None)
 
-    # Step 3: Make NOT NULL and add index
-    for table in TABLES:
-        op.alter_column(table, "user_id", nullable=False)
-        op.create_index(f"ix_{table}_user_id", table, ["user_id"])
+    # Index builds run CONCURRENTLY outside the migration transaction:
+    # a plain CREATE INDEX holds a lock blocking writes on each table for
+    # the duration of the build, serialized across all 11 tables.
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.create_index(
+                f"ix_{table}_user_id",
+                table,
+                ["user_id"],
+                postgresql_concurrently=True,
+            )
 
 
 def downgrade() -> None:
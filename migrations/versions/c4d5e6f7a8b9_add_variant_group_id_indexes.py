@@ -18,21 +18,27 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    op.create_index(
-        "ix_work_experiences_variant_group_id",
-        "work_experiences",
-        ["variant_group_id"],
-    )
-    op.create_index(
-        "ix_projects_variant_group_id",
-        "projects",
-        ["variant_group_id"],
-    )
-    op.create_index(
-        "ix_activities_variant_group_id",
-        "activities",
-        ["variant_group_id"],
-    )
+    # CONCURRENTLY (outside the transaction) so the builds don't block
+    # writes to the three tables while they run.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_work_experiences_variant_group_id",
+            "work_experiences",
+            ["variant_group_id"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_projects_variant_group_id",
+            "projects",
+            ["variant_group_id"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_activities_variant_group_id",
+            "activities",
+            ["variant_group_id"],
+            postgresql_concurrently=True,
+        )
 
 
 def downgrade() -> None:
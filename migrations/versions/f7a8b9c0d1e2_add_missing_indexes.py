@@ -8,6 +8,7 @@ Create Date: 2026-02-21 00:00:00.000000
 from typing import Sequence, Union
 
 from alembic import op
+import sqlalchemy as sa
 
 revision: str = "f7a8b9c0d1e2"
 down_revision: Union[str, None] = "e6f7a8b9c0d1"
@@ -16,22 +17,29 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # FK columns used in WHERE clauses — seq-scanned on every upload query otherwise
-    op.create_index("ix_work_experiences_upload_source_id", "work_experiences", ["upload_source_id"])
-    op.create_index("ix_education_upload_source_id", "education", ["upload_source_id"])
-    op.create_index("ix_projects_upload_source_id", "projects", ["upload_source_id"])
-    op.create_index("ix_activities_upload_source_id", "activities", ["upload_source_id"])
-
-    # cv_versions.application_id: every tailor-result lookup filters on this
-    op.create_index("ix_cv_versions_application_id", "cv_versions", ["application_id"])
-
-    # cv_versions.created_at: ORDER BY DESC on every result fetch
-    op.create_index("ix_cv_versions_created_at", "cv_versions", ["created_at"])
+    # All builds run CONCURRENTLY outside the transaction so live traffic
+    # keeps writing while the indexes come up.
+    with op.get_context().autocommit_block():
+        # FK columns used in WHERE clauses — seq-scanned on every upload query otherwise
+        op.create_index("ix_work_experiences_upload_source_id", "work_experiences", ["upload_source_id"], postgresql_concurrently=True)
+        op.create_index("ix_education_upload_source_id", "education", ["upload_source_id"], postgresql_concurrently=True)
+        op.create_index("ix_projects_upload_source_id", "projects", ["upload_source_id"], postgresql_concurrently=True)
+        op.create_index("ix_activities_upload_source_id", "activities", ["upload_source_id"], postgresql_concurrently=True)
+
+        # Every tailor-result fetch filters on application_id and orders by
+        # created_at DESC — one composite index answers it with an ordered
+        # index walk, where two single-column btrees would need a
+        # bitmap-AND or an index scan plus sort.
+        op.create_index(
+            "ix_cv_versions_app_id_created_at",
+            "cv_versions",
+            ["application_id", sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+        )
 
 
 def downgrade() -> None:
-    op.drop_index("ix_cv_versions_created_at", table_name="cv_versions")
-    op.drop_index("ix_cv_versions_application_id", table_name="cv_versions")
+    op.drop_index("ix_cv_versions_app_id_created_at", table_name="cv_versions")
     op.drop_index("ix_activities_upload_source_id", table_name="activities")
     op.drop_index("ix_projects_upload_source_id", table_name="projects")
     op.drop_index("ix_education_upload_source_id", table_name="education")
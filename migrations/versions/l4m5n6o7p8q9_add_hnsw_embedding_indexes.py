@@ -0,0 +1,37 @@
+"""add hnsw indexes on embedding columns
+
+Revision ID: l4m5n6o7p8q9
+Revises: k3l4m5n6o7p8
+Create Date: 2026-02-24 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "l4m5n6o7p8q9"
+down_revision: Union[str, None] = "k3l4m5n6o7p8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Dedup similarity search orders by embedding <#> :query with LIMIT 5,
+    # which pgvector serves from an HNSW index — without one it seq-scans
+    # and computes the distance for every row. Inner-product ops because
+    # text-embedding-3-small vectors are unit-norm (IP == cosine there).
+    # HNSW builds over existing embeddings are the slowest index builds in
+    # the chain, so they run CONCURRENTLY outside the transaction rather
+    # than blocking writes for the duration.
+    with op.get_context().autocommit_block():
+        for table in ("work_experiences", "projects", "activities"):
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY ix_{table}_embedding_hnsw ON {table} "
+                "USING hnsw (embedding vector_ip_ops) "
+                "WITH (m = 16, ef_construction = 64)"
+            )
+
+
+def downgrade() -> None:
+    for table in ("activities", "projects", "work_experiences"):
+        op.drop_index(f"ix_{table}_embedding_hnsw", table_name=table)
@@ -0,0 +1,70 @@
+"""add search_text columns with pg_trgm indexes for dedup prefiltering
+
+Revision ID: m5n6o7p8q9r0
+Revises: l4m5n6o7p8q9
+Create Date: 2026-02-24 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "m5n6o7p8q9r0"
+down_revision: Union[str, None] = "l4m5n6o7p8q9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_BACKFILL_HEAD = {
+    "work_experiences": ("company", "role_title"),
+    "projects": ("name", "description"),
+    "activities": ("organization", "role_title"),
+}
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Trigram GIN indexes let the dedup query discard lexically unrelated
+    # rows before any vector distance is computed.
+    #
+    # The backfill must mirror deduplicator._embed_input (head + sub +
+    # bullet texts, capped at 200 chars): trigram similarity between a
+    # 200-char query and a head-only ~30-char row sits well below the %
+    # operator's threshold, so a short backfill would prefilter existing
+    # rows out of the search and misclassify real duplicates as new.
+    for table in _BACKFILL_HEAD:
+        op.add_column(table, sa.Column("search_text", sa.Text(), nullable=True))
+
+    # The full-table backfills and the GIN builds run in the autocommit
+    # block: each statement commits on its own, so no single long
+    # transaction holds row locks across all three tables, and the index
+    # builds go CONCURRENTLY so they never block writes.
+    with op.get_context().autocommit_block():
+        for table, (head, sub) in _BACKFILL_HEAD.items():
+            op.execute(
+                f"""
+            UPDATE {table} SET search_text = left(concat_ws(' ',
+                nullif({head}, ''),
+                nullif({sub}, ''),
+                (SELECT string_agg(
+                        CASE
+                            WHEN jsonb_typeof(b) = 'object' THEN nullif(b->>'text', '')
+                            WHEN jsonb_typeof(b) = 'string' THEN nullif(b #>> '{{}}', '')
+                        END, ' ')
+                 FROM jsonb_array_elements(
+                     CASE WHEN jsonb_typeof(bullets) = 'array' THEN bullets
+                          ELSE '[]'::jsonb END) AS b)
+            ), 200)
+            """
+            )
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY ix_{table}_search_text_trgm ON {table} "
+                "USING gin (search_text gin_trgm_ops)"
+            )
+
+
+def downgrade() -> None:
+    for table in ("activities", "projects", "work_experiences"):
+        op.drop_index(f"ix_{table}_search_text_trgm", table_name=table)
+        op.drop_column(table, "search_text")
@@ -0,0 +1,41 @@
+"""add content_hash columns for exact-duplicate short-circuit
+
+Revision ID: n6o7p8q9r0s1
+Revises: m5n6o7p8q9r0
+Create Date: 2026-02-24 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "n6o7p8q9r0s1"
+down_revision: Union[str, None] = "m5n6o7p8q9r0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # blake2b-128 of the embed input text. Existing rows stay NULL (Postgres
+    # has no blake2b); they are backfilled by the re-embed maintenance path
+    # and simply miss the short-circuit until then.
+    for table in ("work_experiences", "projects", "activities"):
+        op.add_column(table, sa.Column("content_hash", sa.LargeBinary(), nullable=True))
+
+    # CONCURRENTLY (outside the transaction) so the builds don't block
+    # writes while they run.
+    with op.get_context().autocommit_block():
+        for table in ("work_experiences", "projects", "activities"):
+            op.create_index(
+                f"ix_{table}_content_hash",
+                table,
+                ["content_hash"],
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    for table in ("activities", "projects", "work_experiences"):
+        op.drop_index(f"ix_{table}_content_hash", table_name=table)
+        op.drop_column(table, "content_hash")